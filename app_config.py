@@ -2,18 +2,130 @@
 Application configuration and initialization for Camera Privacy Manager
 Handles startup sequence, dependency initialization, and configuration management
 """
+import atexit
+import copy
+import functools
+import heapq
+import importlib.util
 import logging
+import logging.handlers
 import os
+import signal
 import sys
+import threading
 from pathlib import Path
 from datetime import datetime
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from error_handling import logged_errors
 from config import (
     APP_NAME, APP_VERSION, DATABASE_FILE, MEDIA_DIR, 
-    REQUIRE_ADMIN, BASE_DIR
+    REQUIRE_ADMIN, BASE_DIR, ensure_dirs
 )
 
+# Number of log records buffered in memory before they are written to disk
+DEFAULT_LOG_BUFFER_RECORDS = 512
+
+# Delay before pending setting changes are written to disk (seconds)
+SETTINGS_FLUSH_DELAY = 0.5
+
+# Bump when initialize_directories starts creating a new directory
+DIRS_INITIALIZED_VERSION = 1
+
+# Buffer size used when copying files into a backup
+BACKUP_COPY_BUFFER_SIZE = 1 << 20
+
+
+# Default application settings, built once at import time
+_DEFAULT_SETTINGS_TEMPLATE = {
+    "app": {
+        "name": APP_NAME,
+        "version": APP_VERSION,
+        "first_run": True,
+        "last_startup": None,
+        "startup_count": 0
+    },
+    "security": {
+        "require_admin": REQUIRE_ADMIN,
+        "max_failed_attempts": 3,
+        "failed_attempt_window_minutes": 15,
+        "auto_cleanup_days": 30,
+        "password_min_length": 8
+    },
+    "email": {
+        "smtp_server": "",
+        "smtp_port": 587,
+        "username": "",
+        "password": "",
+        "from_email": "",
+        "use_tls": True,
+        "recipients": []
+    },
+    "camera": {
+        "intrusion_video_duration": 10,
+        "default_device_id": 0,
+        "capture_format": "avi"
+    },
+    "gui": {
+        "window_width": 400,
+        "window_height": 300,
+        "popup_display_time": 3000,
+        "remember_window_position": False
+    },
+    "logging": {
+        "log_level": "INFO",
+        "max_log_files": 30,
+        "max_log_size_mb": 10,
+        "buffer_records": DEFAULT_LOG_BUFFER_RECORDS
+    }
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_settings_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a settings file; cached until its mtime or size changes"""
+    if orjson:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_requirements() -> tuple:
+    """Probe interpreter and dependency requirements, returning any issues"""
+    issues = []
+    
+    if sys.version_info < (3, 8):
+        issues.append("Python 3.8 or higher is required")
+    
+    # Locate modules without importing them; heavyweight ones like cv2 are
+    # loaded later by the code that uses them
+    required_modules = ['cv2', 'tkinter', 'sqlite3', 'smtplib']
+    for module in required_modules:
+        if module in sys.modules:
+            continue
+        try:
+            found = importlib.util.find_spec(module) is not None
+        except (ImportError, ValueError):
+            found = False
+        if not found:
+            issues.append(f"Required module not found: {module}")
+    
+    try:
+        import sqlite3
+        conn = sqlite3.connect(":memory:")
+        conn.close()
+    except Exception:
+        issues.append("SQLite database not accessible")
+    
+    return tuple(issues)
+
 
 class AppConfig:
     """Application configuration and initialization manager"""
@@ -24,18 +136,42 @@ class AppConfig:
         self.config_file = BASE_DIR / "app_settings.json"
         self.log_file = BASE_DIR / "app.log"
         self.settings = {}
+        self.log_buffer = None
+        self.log_file_handler = None
+        
+        # Pending setting changes are coalesced into a single save
+        self._dirty = False
+        self._flush_timer = None
+        self._batch_depth = 0
+        self._flush_lock = threading.RLock()
         
         # Initialize logging first
         self.setup_logging()
         
         # Load configuration
         self.load_configuration()
+        self.apply_logging_settings()
         
         # Initialize directories
         self.initialize_directories()
         
+        atexit.register(self.flush)
+        
         self.logger.info(f"{APP_NAME} v{APP_VERSION} initializing...")
     
+    def __enter__(self):
+        """Batch setting changes; they are saved once when the block exits"""
+        with self._flush_lock:
+            self._batch_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        with self._flush_lock:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+        return False
+    
     def setup_logging(self):
         """Configure application logging"""
         try:
@@ -46,14 +182,30 @@ class AppConfig:
             # Configure logging
             log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
             
-            # File handler
-            file_handler = logging.FileHandler(
-                log_dir / f"camera_privacy_{datetime.now().strftime('%Y%m%d')}.log",
-                encoding='utf-8'
+            # Rotating file handler; the file is not opened until the first write
+            logging_defaults = _DEFAULT_SETTINGS_TEMPLATE["logging"]
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_dir / "camera_privacy.log",
+                maxBytes=logging_defaults["max_log_size_mb"] * 1024 * 1024,
+                backupCount=logging_defaults["max_log_files"],
+                encoding='utf-8',
+                delay=True
             )
+            self.log_file_handler = file_handler
             file_handler.setLevel(logging.INFO)
             file_handler.setFormatter(logging.Formatter(log_format))
             
+            # Buffer records in memory so INFO/DEBUG output is written in batches;
+            # errors flush the buffer immediately
+            self.log_buffer = logging.handlers.MemoryHandler(
+                capacity=DEFAULT_LOG_BUFFER_RECORDS,
+                flushLevel=logging.ERROR,
+                target=file_handler
+            )
+            self.log_buffer.setLevel(logging.INFO)
+            atexit.register(self.flush_logs)
+            self._install_sigterm_flush()
+            
             # Console handler
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setLevel(logging.WARNING)
@@ -62,7 +214,7 @@ class AppConfig:
             # Root logger configuration
             logging.basicConfig(
                 level=logging.INFO,
-                handlers=[file_handler, console_handler],
+                handlers=[self.log_buffer, console_handler],
                 format=log_format
             )
             
@@ -75,12 +227,53 @@ class AppConfig:
             logging.basicConfig(level=logging.INFO)
             self.logger = logging.getLogger(__name__)
     
+    def _install_sigterm_flush(self):
+        """Flush buffered log records before the process is terminated"""
+        try:
+            previous_handler = signal.getsignal(signal.SIGTERM)
+            
+            def handle_sigterm(signum, frame):
+                self.flush_logs()
+                if callable(previous_handler):
+                    previous_handler(signum, frame)
+                elif previous_handler == signal.SIG_DFL:
+                    sys.exit(128 + signum)
+                # SIGTERM was ignored before (SIG_IGN), so keep running
+            
+            signal.signal(signal.SIGTERM, handle_sigterm)
+        except (ValueError, OSError):
+            # Signal handlers can only be installed from the main thread
+            pass
+    
+    def flush_logs(self):
+        """Write any buffered log records to the log file"""
+        if self.log_buffer:
+            self.log_buffer.flush()
+    
+    def apply_logging_settings(self):
+        """Apply the configured log buffer capacity and rotation limits"""
+        if self.log_buffer:
+            capacity = self.get_setting("logging", "buffer_records", DEFAULT_LOG_BUFFER_RECORDS)
+            if isinstance(capacity, int) and capacity > 0:
+                self.log_buffer.capacity = capacity
+        
+        if self.log_file_handler:
+            max_size_mb = self.get_setting("logging", "max_log_size_mb")
+            if isinstance(max_size_mb, (int, float)) and max_size_mb > 0:
+                self.log_file_handler.maxBytes = int(max_size_mb * 1024 * 1024)
+            max_files = self.get_setting("logging", "max_log_files")
+            if isinstance(max_files, int) and max_files >= 0:
+                self.log_file_handler.backupCount = max_files
+    
     def load_configuration(self):
         """Load application configuration from file"""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self.settings = json.load(f)
+                st = self.config_file.stat()
+                # Copy so callers mutating settings never touch the cached dict
+                self.settings = copy.deepcopy(
+                    _load_settings_cached(str(self.config_file), st.st_mtime_ns, st.st_size)
+                )
                 self.logger.info("Configuration loaded from file")
             else:
                 # Create default configuration
@@ -94,76 +287,41 @@ class AppConfig:
     
     def get_default_settings(self):
         """Get default application settings"""
-        return {
-            "app": {
-                "name": APP_NAME,
-                "version": APP_VERSION,
-                "first_run": True,
-                "last_startup": None,
-                "startup_count": 0
-            },
-            "security": {
-                "require_admin": REQUIRE_ADMIN,
-                "max_failed_attempts": 3,
-                "failed_attempt_window_minutes": 15,
-                "auto_cleanup_days": 30,
-                "password_min_length": 8
-            },
-            "email": {
-                "smtp_server": "",
-                "smtp_port": 587,
-                "username": "",
-                "password": "",
-                "from_email": "",
-                "use_tls": True,
-                "recipients": []
-            },
-            "camera": {
-                "intrusion_video_duration": 10,
-                "default_device_id": 0,
-                "capture_format": "avi"
-            },
-            "gui": {
-                "window_width": 400,
-                "window_height": 300,
-                "popup_display_time": 3000,
-                "remember_window_position": False
-            },
-            "logging": {
-                "log_level": "INFO",
-                "max_log_files": 30,
-                "max_log_size_mb": 10
-            }
-        }
+        return copy.deepcopy(_DEFAULT_SETTINGS_TEMPLATE)
     
+    @logged_errors("Failed to save configuration", reraise=False)
     def save_configuration(self):
         """Save current configuration to file"""
-        try:
+        if orjson:
+            self.config_file.write_bytes(orjson.dumps(self.settings, option=orjson.OPT_INDENT_2))
+        else:
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 json.dump(self.settings, f, indent=2, ensure_ascii=False)
-            self.logger.info("Configuration saved to file")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to save configuration: {e}")
+        # Only a completed write clears pending changes; a failed one is
+        # retried by the next flush (at the latest on exit)
+        self._dirty = False
+        self.logger.info("Configuration saved to file")
     
+    @logged_errors("Failed to initialize directories")
     def initialize_directories(self):
         """Initialize required directories"""
-        try:
-            directories = [
-                MEDIA_DIR,
-                BASE_DIR / "logs",
-                BASE_DIR / "backups"
-            ]
-            
-            for directory in directories:
-                directory.mkdir(exist_ok=True)
-                self.logger.debug(f"Directory initialized: {directory}")
-            
-            self.logger.info("All directories initialized")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to initialize directories: {e}")
-            raise
+        # Directories were already created by a previous startup
+        if self.get_setting("app", "dirs_initialized_version") == DIRS_INITIALIZED_VERSION:
+            return
+        
+        ensure_dirs()
+        
+        directories = [
+            BASE_DIR / "logs",
+            BASE_DIR / "backups"
+        ]
+        
+        for directory in directories:
+            directory.mkdir(exist_ok=True)
+            self.logger.debug(f"Directory initialized: {directory}")
+        
+        self.set_setting("app", "dirs_initialized_version", DIRS_INITIALIZED_VERSION)
+        self.logger.info("All directories initialized")
     
     def check_system_requirements(self):
         """Check system requirements and dependencies"""
@@ -171,20 +329,12 @@ class AppConfig:
         issues = []
         
         try:
-            # Check Python version
-            if sys.version_info < (3, 8):
-                issues.append("Python 3.8 or higher is required")
+            # Check Python version, required modules and SQLite (cached per process)
+            probe_issues = _probe_requirements()
+            if probe_issues:
+                issues.extend(probe_issues)
                 requirements_met = False
             
-            # Check required modules
-            required_modules = ['cv2', 'tkinter', 'sqlite3', 'smtplib']
-            for module in required_modules:
-                try:
-                    __import__(module)
-                except ImportError:
-                    issues.append(f"Required module not found: {module}")
-                    requirements_met = False
-            
             # Check file permissions
             try:
                 test_file = BASE_DIR / "test_permissions.tmp"
@@ -194,15 +344,6 @@ class AppConfig:
                 issues.append("Insufficient file system permissions")
                 requirements_met = False
             
-            # Check database accessibility
-            try:
-                import sqlite3
-                conn = sqlite3.connect(":memory:")
-                conn.close()
-            except Exception:
-                issues.append("SQLite database not accessible")
-                requirements_met = False
-            
             if requirements_met:
                 self.logger.info("All system requirements met")
             else:
@@ -214,61 +355,58 @@ class AppConfig:
             self.logger.error(f"Error checking system requirements: {e}")
             return False, [f"Error checking requirements: {e}"]
     
+    @logged_errors("Failed to initialize database", reraise=False, default=False)
     def initialize_database(self):
         """Initialize database and perform any necessary migrations"""
-        try:
-            from database.database_manager import DatabaseManager
-            
-            db_manager = DatabaseManager()
-            
-            # Check if this is a fresh installation
-            user_count = db_manager.get_user_count()
-            if user_count == 0:
-                self.settings["app"]["first_run"] = True
-                self.logger.info("Fresh installation detected")
-            else:
-                self.settings["app"]["first_run"] = False
-                self.logger.info(f"Existing installation with {user_count} users")
-            
-            self.logger.info("Database initialized successfully")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to initialize database: {e}")
-            return False
+        from database.database_manager import DatabaseManager
+        
+        db_manager = DatabaseManager()
+        
+        # Check if this is a fresh installation
+        user_count = db_manager.get_user_count()
+        if user_count == 0:
+            self.settings["app"]["first_run"] = True
+            self.logger.info("Fresh installation detected")
+        else:
+            self.settings["app"]["first_run"] = False
+            self.logger.info(f"Existing installation with {user_count} users")
+        
+        self.logger.info("Database initialized successfully")
+        return True
     
+    @logged_errors("Failed to update startup info", reraise=False)
     def update_startup_info(self):
         """Update startup information"""
-        try:
-            self.settings["app"]["last_startup"] = datetime.now().isoformat()
-            self.settings["app"]["startup_count"] = self.settings["app"].get("startup_count", 0) + 1
-            self.save_configuration()
-            
-            self.logger.info(f"Startup #{self.settings['app']['startup_count']}")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to update startup info: {e}")
+        self.settings["app"]["last_startup"] = datetime.now().isoformat()
+        self.settings["app"]["startup_count"] = self.settings["app"].get("startup_count", 0) + 1
+        self.save_configuration()
+        
+        self.logger.info(f"Startup #{self.settings['app']['startup_count']}")
     
+    @logged_errors("Failed to cleanup old logs", reraise=False)
     def cleanup_old_logs(self):
-        """Cleanup old log files"""
-        try:
-            log_dir = BASE_DIR / "logs"
-            if not log_dir.exists():
-                return
-            
-            max_files = self.settings["logging"]["max_log_files"]
-            log_files = sorted(log_dir.glob("camera_privacy_*.log"))
-            
-            if len(log_files) > max_files:
-                files_to_delete = log_files[:-max_files]
-                for file_path in files_to_delete:
-                    file_path.unlink()
-                    self.logger.debug(f"Deleted old log file: {file_path}")
-                
-                self.logger.info(f"Cleaned up {len(files_to_delete)} old log files")
+        """Cleanup daily log files left over from before log rotation was used"""
+        log_dir = BASE_DIR / "logs"
+        if not log_dir.exists():
+            return
+        
+        max_files = self.settings["logging"]["max_log_files"]
+        with os.scandir(log_dir) as it:
+            log_files = [
+                entry for entry in it
+                if entry.name.startswith("camera_privacy_") and entry.name.endswith(".log")
+            ]
+        
+        excess = len(log_files) - max_files
+        if excess > 0:
+            files_to_delete = heapq.nsmallest(
+                excess, log_files, key=lambda entry: entry.stat().st_mtime
+            )
+            for entry in files_to_delete:
+                os.unlink(entry.path)
+                self.logger.debug(f"Deleted old log file: {entry.path}")
             
-        except Exception as e:
-            self.logger.error(f"Failed to cleanup old logs: {e}")
+            self.logger.info(f"Cleaned up {len(files_to_delete)} old log files")
     
     def get_setting(self, section: str, key: str, default=None):
         """Get a configuration setting"""
@@ -283,11 +421,32 @@ class AppConfig:
             if section not in self.settings:
                 self.settings[section] = {}
             self.settings[section][key] = value
-            self.save_configuration()
+            self._schedule_flush()
             
         except Exception as e:
             self.logger.error(f"Failed to set setting {section}.{key}: {e}")
     
+    def _schedule_flush(self):
+        """Mark settings dirty and (re)start the debounced save timer"""
+        with self._flush_lock:
+            self._dirty = True
+            if self._batch_depth:
+                return
+            if self._flush_timer:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(SETTINGS_FLUSH_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def flush(self):
+        """Save pending setting changes immediately"""
+        with self._flush_lock:
+            if self._flush_timer:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._dirty:
+                self.save_configuration()
+    
     def is_first_run(self):
         """Check if this is the first run of the application"""
         return self.settings["app"].get("first_run", True)
@@ -305,31 +464,43 @@ class AppConfig:
             "media_directory": str(MEDIA_DIR)
         }
     
+    @logged_errors("Failed to create backup", reraise=False, default=False)
     def create_backup(self):
         """Create backup of important files"""
+        backup_dir = BASE_DIR / "backups"
+        backup_dir.mkdir(exist_ok=True)
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        backup_name = f"backup_{timestamp}"
+        
+        # Backup database
+        if DATABASE_FILE.exists():
+            self._backup_database(backup_dir / f"{backup_name}_database.db")
+        
+        # Backup configuration
+        if self.config_file.exists():
+            self._copy_file(self.config_file, backup_dir / f"{backup_name}_config.json")
+        
+        self.logger.info(f"Backup created: {backup_name}")
+        return True
+    
+    def _backup_database(self, destination: Path):
+        """Write a consistent copy of the database, even while it is in use"""
+        from database.database_manager import DatabaseManager
+        
+        db_manager = DatabaseManager(str(DATABASE_FILE))
         try:
-            backup_dir = BASE_DIR / "backups"
-            backup_dir.mkdir(exist_ok=True)
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_name = f"backup_{timestamp}"
-            
-            import shutil
-            
-            # Backup database
-            if DATABASE_FILE.exists():
-                shutil.copy2(DATABASE_FILE, backup_dir / f"{backup_name}_database.db")
-            
-            # Backup configuration
-            if self.config_file.exists():
-                shutil.copy2(self.config_file, backup_dir / f"{backup_name}_config.json")
-            
-            self.logger.info(f"Backup created: {backup_name}")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to create backup: {e}")
-            return False
+            db_manager.backup_to(str(destination))
+        finally:
+            db_manager.close()
+    
+    def _copy_file(self, source: Path, destination: Path):
+        """Copy a file with a 1 MiB buffer, preserving its metadata"""
+        import shutil
+        
+        with open(source, 'rb') as src, open(destination, 'wb') as dst:
+            shutil.copyfileobj(src, dst, length=BACKUP_COPY_BUFFER_SIZE)
+        shutil.copystat(source, destination)
     
     def validate_configuration(self):
         """Validate current configuration"""
@@ -33,8 +33,11 @@ BASE_DIR = Path(__file__).parent
 MEDIA_DIR = BASE_DIR / INTRUSION_MEDIA_DIR
 DATABASE_FILE = BASE_DIR / DATABASE_PATH
 
-# Ensure directories exist
-MEDIA_DIR.mkdir(exist_ok=True)
+
+def ensure_dirs():
+    """Ensure directories exist"""
+    MEDIA_DIR.mkdir(exist_ok=True)
+
 
 # Administrative settings
 REQUIRE_ADMIN = True
\ No newline at end of file
@@ -4,29 +4,85 @@ Handles SQLite database operations and schema management
 """
 import sqlite3
 import logging
+import threading
+from collections import deque
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 from pathlib import Path
 
 from models.data_models import User, LogEntry, IntrusionAttempt
 from config import DATABASE_FILE
+from error_handling import logged_errors
+
+# Queued log rows are written at least this often (seconds)...
+LOG_FLUSH_INTERVAL = 0.2
+# ...or as soon as this many rows are pending
+LOG_FLUSH_BATCH_SIZE = 100
+
+# Rows fetched per round-trip when streaming query results
+FETCH_BATCH_SIZE = 256
+
+# Online backup copies this many pages per step, pausing between steps (seconds)
+BACKUP_PAGES_PER_STEP = 1000
+BACKUP_STEP_SLEEP = 0.010
+
+
+def _convert_timestamp(value: bytes) -> datetime:
+    """Convert a TIMESTAMP column value to a datetime"""
+    return datetime.fromisoformat(value.decode())
+
+
+# Explicit converter; the sqlite3 default converters are deprecated since 3.12
+sqlite3.register_converter("TIMESTAMP", _convert_timestamp)
 
 
 class DatabaseManager:
     """Manages database operations for the Camera Privacy Manager"""
     
+    # SQL text is kept constant so the connection's statement cache always hits
+    _SQL_INSERT_USER = "INSERT INTO users (username, password_hash) VALUES (?, ?)"
+    _SQL_SELECT_USER = "SELECT id, username, password_hash, created_at FROM users WHERE username = ?"
+    _SQL_COUNT_USERS = "SELECT COUNT(*) FROM users"
+    _SQL_INSERT_ACCESS_LOG = "INSERT INTO access_logs (user_id, action) VALUES (?, ?)"
+    _SQL_SELECT_USER_ACCESS_LOGS = "SELECT id, user_id, action, timestamp FROM access_logs WHERE user_id = ? ORDER BY timestamp DESC LIMIT ?"
+    _SQL_SELECT_ACCESS_LOGS = "SELECT id, user_id, action, timestamp FROM access_logs ORDER BY timestamp DESC LIMIT ?"
+    _SQL_INSERT_INTRUSION = "INSERT INTO intrusion_attempts (media_path, ip_address) VALUES (?, ?)"
+    _SQL_SELECT_INTRUSIONS = "SELECT id, timestamp, media_path, ip_address FROM intrusion_attempts ORDER BY timestamp DESC LIMIT ?"
+    
     def __init__(self, db_path: str = None):
         """Initialize database manager with optional custom database path"""
         self.db_path = db_path or str(DATABASE_FILE)
         self.logger = logging.getLogger(__name__)
+        self._conn = None
+        self._lock = threading.RLock()
+        
+        # Log rows queued by the *_async methods, written in batches
+        self._pending_access_logs = deque()
+        self._pending_intrusions = deque()
+        self._flush_event = threading.Event()
+        self._flush_thread = None
+        self._closing = False
+        
         self._init_database()
     
     def _init_database(self):
-        """Initialize database and create tables if they don't exist"""
+        """Open the shared connection and create tables if they don't exist"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                self._create_tables(conn)
-                self.logger.info("Database initialized successfully")
+            # One long-lived autocommit connection shared by all operations
+            self._conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                isolation_level=None,
+                cached_statements=256,
+                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
+            )
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            with self._lock:
+                self._create_tables(self._conn)
+            self.logger.info("Database initialized successfully")
         except sqlite3.Error as e:
             self.logger.error(f"Database initialization failed: {e}")
             raise
@@ -66,18 +122,26 @@ class DatabaseManager:
             )
         """)
         
-        conn.commit()
+        # Indexes backing the ORDER BY timestamp DESC / WHERE user_id queries
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_access_logs_user_ts ON access_logs(user_id, timestamp DESC)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_access_logs_ts ON access_logs(timestamp DESC)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_intrusion_ts ON intrusion_attempts(timestamp DESC)"
+        )
     
     def create_user(self, username: str, password_hash: str) -> int:
         """Create a new user and return user ID"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
+            with self._lock:
+                cursor = self._conn.cursor()
                 cursor.execute(
-                    "INSERT INTO users (username, password_hash) VALUES (?, ?)",
+                    self._SQL_INSERT_USER,
                     (username, password_hash)
                 )
-                conn.commit()
                 user_id = cursor.lastrowid
                 self.logger.info(f"User created successfully: {username}")
                 return user_id
@@ -88,126 +152,264 @@ class DatabaseManager:
             self.logger.error(f"Failed to create user: {e}")
             raise
     
+    @logged_errors("Failed to retrieve user", exceptions=sqlite3.Error)
     def get_user_by_username(self, username: str) -> Optional[User]:
         """Retrieve user by username"""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT id, username, password_hash, created_at FROM users WHERE username = ?",
-                    (username,)
-                )
-                row = cursor.fetchone()
-                if row:
-                    return User(
-                        id=row[0],
-                        username=row[1],
-                        password_hash=row[2],
-                        created_at=datetime.fromisoformat(row[3])
-                    )
-                return None
-        except sqlite3.Error as e:
-            self.logger.error(f"Failed to retrieve user: {e}")
-            raise
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute(
+                self._SQL_SELECT_USER,
+                (username,)
+            )
+            row = cursor.fetchone()
+            if row:
+                return User(**dict(row))
+            return None
     
+    @logged_errors("Failed to log access", exceptions=sqlite3.Error)
     def log_access(self, user_id: int, action: str) -> int:
         """Log camera access action"""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "INSERT INTO access_logs (user_id, action) VALUES (?, ?)",
-                    (user_id, action)
-                )
-                conn.commit()
-                log_id = cursor.lastrowid
-                self.logger.info(f"Access logged: {action} for user {user_id}")
-                return log_id
-        except sqlite3.Error as e:
-            self.logger.error(f"Failed to log access: {e}")
-            raise
+        with self._lock:
+            self._flush_pending_logs()
+            cursor = self._conn.cursor()
+            cursor.execute(
+                self._SQL_INSERT_ACCESS_LOG,
+                (user_id, action)
+            )
+            log_id = cursor.lastrowid
+            self.logger.info(f"Access logged: {action} for user {user_id}")
+            return log_id
     
+    @logged_errors("Failed to retrieve access logs", exceptions=sqlite3.Error)
     def get_access_logs(self, user_id: int = None, limit: int = 100) -> List[LogEntry]:
         """Retrieve access logs, optionally filtered by user"""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                if user_id:
-                    cursor.execute(
-                        "SELECT id, user_id, action, timestamp FROM access_logs WHERE user_id = ? ORDER BY timestamp DESC LIMIT ?",
-                        (user_id, limit)
-                    )
-                else:
-                    cursor.execute(
-                        "SELECT id, user_id, action, timestamp FROM access_logs ORDER BY timestamp DESC LIMIT ?",
-                        (limit,)
-                    )
-                
-                logs = []
-                for row in cursor.fetchall():
-                    logs.append(LogEntry(
-                        id=row[0],
-                        user_id=row[1],
-                        action=row[2],
-                        timestamp=datetime.fromisoformat(row[3])
-                    ))
-                return logs
-        except sqlite3.Error as e:
-            self.logger.error(f"Failed to retrieve access logs: {e}")
-            raise
+        return list(self.iter_access_logs(user_id, limit))
+    
+    def iter_access_logs(self, user_id: int = None, limit: int = 100) -> Iterator[LogEntry]:
+        """Stream access logs, optionally filtered by user"""
+        if user_id:
+            rows = self._iter_rows(self._SQL_SELECT_USER_ACCESS_LOGS, (user_id, limit))
+        else:
+            rows = self._iter_rows(self._SQL_SELECT_ACCESS_LOGS, (limit,))
+        
+        for row in rows:
+            yield LogEntry(**dict(row))
+    
+    @logged_errors("Failed to retrieve access logs", exceptions=sqlite3.Error)
+    def get_access_logs_in_range(self, start_date: Optional[datetime], end_date: Optional[datetime],
+                                 action_patterns: List[str] = None, user_id: int = None,
+                                 limit: int = 1000) -> List[LogEntry]:
+        """
+        Retrieve access logs within a date range, newest first
+        
+        Args:
+            start_date: Start of date range, None for unbounded
+            end_date: End of date range, None for unbounded
+            action_patterns: Optional LIKE patterns; a log matches if its action matches any
+            user_id: Optional user ID to filter logs
+            limit: Maximum number of logs to retrieve
+        """
+        conditions, params = self._timestamp_range(start_date, end_date)
+        if user_id:
+            conditions.append("user_id = ?")
+            params.append(user_id)
+        if action_patterns:
+            conditions.append("(" + " OR ".join(["action LIKE ?"] * len(action_patterns)) + ")")
+            params.extend(action_patterns)
+        
+        sql = "SELECT id, user_id, action, timestamp FROM access_logs"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY timestamp DESC LIMIT ?"
+        params.append(limit)
+        
+        return [LogEntry(**dict(row)) for row in self._iter_rows(sql, tuple(params))]
+    
+    @logged_errors("Failed to retrieve intrusion attempts", exceptions=sqlite3.Error)
+    def get_intrusion_attempts_in_range(self, start_date: Optional[datetime], end_date: Optional[datetime],
+                                        limit: int = 1000) -> List[IntrusionAttempt]:
+        """Retrieve intrusion attempts within a date range (None bounds are open), newest first"""
+        conditions, params = self._timestamp_range(start_date, end_date)
+        sql = "SELECT id, timestamp, media_path, ip_address FROM intrusion_attempts"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY timestamp DESC LIMIT ?"
+        params.append(limit)
+        return [IntrusionAttempt(**dict(row)) for row in self._iter_rows(sql, tuple(params))]
+    
+    @classmethod
+    def _timestamp_range(cls, start_date: Optional[datetime],
+                         end_date: Optional[datetime]) -> Tuple[List[str], list]:
+        """WHERE conditions and parameters for a timestamp range; None bounds are omitted"""
+        conditions, params = [], []
+        if start_date is not None:
+            conditions.append("timestamp >= ?")
+            params.append(cls._format_timestamp(start_date))
+        if end_date is not None:
+            conditions.append("timestamp <= ?")
+            params.append(cls._format_timestamp(end_date))
+        return conditions, params
+    
+    @staticmethod
+    def _format_timestamp(value: datetime) -> str:
+        """Format a datetime the way SQLite's CURRENT_TIMESTAMP stores it"""
+        return value.isoformat(sep=' ')
     
+    @logged_errors("Failed to log intrusion attempt", exceptions=sqlite3.Error)
     def log_intrusion_attempt(self, media_path: str, ip_address: str = None) -> int:
         """Log intrusion attempt"""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "INSERT INTO intrusion_attempts (media_path, ip_address) VALUES (?, ?)",
-                    (media_path, ip_address)
-                )
-                conn.commit()
-                intrusion_id = cursor.lastrowid
-                self.logger.warning(f"Intrusion attempt logged: {media_path}")
-                return intrusion_id
-        except sqlite3.Error as e:
-            self.logger.error(f"Failed to log intrusion attempt: {e}")
-            raise
+        with self._lock:
+            self._flush_pending_logs()
+            cursor = self._conn.cursor()
+            cursor.execute(
+                self._SQL_INSERT_INTRUSION,
+                (media_path, ip_address)
+            )
+            intrusion_id = cursor.lastrowid
+            self.logger.warning(f"Intrusion attempt logged: {media_path}")
+            return intrusion_id
     
+    @logged_errors("Failed to retrieve intrusion attempts", exceptions=sqlite3.Error)
     def get_intrusion_attempts(self, limit: int = 50) -> List[IntrusionAttempt]:
         """Retrieve intrusion attempts"""
+        return list(self.iter_intrusion_attempts(limit))
+    
+    def iter_intrusion_attempts(self, limit: int = 50) -> Iterator[IntrusionAttempt]:
+        """Stream intrusion attempts"""
+        for row in self._iter_rows(self._SQL_SELECT_INTRUSIONS, (limit,)):
+            yield IntrusionAttempt(**dict(row))
+    
+    def _iter_rows(self, sql: str, params: tuple) -> Iterator[sqlite3.Row]:
+        """Run a query and yield its rows in FETCH_BATCH_SIZE chunks"""
+        with self._lock:
+            self._flush_pending_logs()
+            cursor = self._conn.execute(sql, params)
+        
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(FETCH_BATCH_SIZE)
+            if not rows:
+                break
+            yield from rows
+    
+    def log_access_async(self, user_id: int, action: str):
+        """Queue a camera access action to be written with the next batch"""
+        self._pending_access_logs.append((user_id, action))
+        self._schedule_flush(len(self._pending_access_logs))
+    
+    def log_intrusion_attempt_async(self, media_path: str, ip_address: str = None):
+        """Queue an intrusion attempt to be written with the next batch"""
+        self._pending_intrusions.append((media_path, ip_address))
+        self._schedule_flush(len(self._pending_intrusions))
+    
+    @logged_errors("Failed to flush pending logs", exceptions=sqlite3.Error)
+    def flush_pending_logs(self):
+        """Write all queued log rows to the database"""
+        with self._lock:
+            self._flush_pending_logs()
+    
+    def _schedule_flush(self, pending_count: int):
+        """Start the flush worker if needed and wake it when a batch is full"""
+        if self._flush_thread is None:
+            with self._lock:
+                if self._flush_thread is None and not self._closing:
+                    self._flush_thread = threading.Thread(
+                        target=self._flush_loop,
+                        name="DatabaseLogFlusher",
+                        daemon=True
+                    )
+                    self._flush_thread.start()
+        if pending_count >= LOG_FLUSH_BATCH_SIZE:
+            self._flush_event.set()
+    
+    def _flush_loop(self):
+        """Background worker writing queued log rows in batches"""
+        while not self._closing:
+            self._flush_event.wait(LOG_FLUSH_INTERVAL)
+            self._flush_event.clear()
+            try:
+                with self._lock:
+                    self._flush_pending_logs()
+            except sqlite3.Error as e:
+                # The rows stay queued and are retried on the next pass
+                self.logger.error(f"Failed to flush pending logs, retrying: {e}")
+    
+    def _flush_pending_logs(self):
+        """Write queued log rows in a single transaction (caller holds the lock)"""
+        if self._conn is None:
+            return
+        
+        access_rows = []
+        while self._pending_access_logs:
+            access_rows.append(self._pending_access_logs.popleft())
+        intrusion_rows = []
+        while self._pending_intrusions:
+            intrusion_rows.append(self._pending_intrusions.popleft())
+        
+        if not access_rows and not intrusion_rows:
+            return
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT id, timestamp, media_path, ip_address FROM intrusion_attempts ORDER BY timestamp DESC LIMIT ?",
-                    (limit,)
+            self._conn.execute("BEGIN")
+            if access_rows:
+                self._conn.executemany(
+                    self._SQL_INSERT_ACCESS_LOG,
+                    access_rows
                 )
-                
-                attempts = []
-                for row in cursor.fetchall():
-                    attempts.append(IntrusionAttempt(
-                        id=row[0],
-                        timestamp=datetime.fromisoformat(row[1]),
-                        media_path=row[2],
-                        ip_address=row[3]
-                    ))
-                return attempts
-        except sqlite3.Error as e:
-            self.logger.error(f"Failed to retrieve intrusion attempts: {e}")
+            if intrusion_rows:
+                self._conn.executemany(
+                    self._SQL_INSERT_INTRUSION,
+                    intrusion_rows
+                )
+            self._conn.execute("COMMIT")
+        except sqlite3.Error:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            # Put the rows back ahead of anything queued meanwhile so a
+            # failed write (e.g. a locked database) loses nothing
+            self._pending_access_logs.extendleft(reversed(access_rows))
+            self._pending_intrusions.extendleft(reversed(intrusion_rows))
             raise
+        
+        self.logger.info(
+            f"Flushed {len(access_rows)} access logs and {len(intrusion_rows)} intrusion attempts"
+        )
+    
+    @logged_errors("Failed to back up database", exceptions=sqlite3.Error)
+    def backup_to(self, path: str):
+        """Copy the database to path using SQLite's online backup API"""
+        destination = sqlite3.connect(path)
+        try:
+            with self._lock:
+                self._flush_pending_logs()
+            # Pages are copied in steps, so writers are only briefly blocked
+            self._conn.backup(destination, pages=BACKUP_PAGES_PER_STEP, sleep=BACKUP_STEP_SLEEP)
+            self.logger.info(f"Database backed up to {path}")
+        finally:
+            destination.close()
     
     def close(self):
         """Close database connection (for cleanup)"""
-        # SQLite connections are automatically closed when using context manager
-        pass
+        self._closing = True
+        self._flush_event.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join()
+            self._flush_thread = None
+        
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._flush_pending_logs()
+                except sqlite3.Error as e:
+                    self.logger.error(f"Failed to flush pending logs on close: {e}")
+                finally:
+                    self._conn.close()
+                    self._conn = None
     
+    @logged_errors("Failed to get user count", exceptions=sqlite3.Error)
     def get_user_count(self) -> int:
         """Get total number of users"""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM users")
-                return cursor.fetchone()[0]
-        except sqlite3.Error as e:
-            self.logger.error(f"Failed to get user count: {e}")
-            raise
\ No newline at end of file
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute(self._SQL_COUNT_USERS)
+            return cursor.fetchone()[0]
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""
+Error handling helpers for Camera Privacy Manager
+Provides the shared log-and-handle decorator used by manager classes
+"""
+import functools
+
+
+def logged_errors(message: str, reraise: bool = True, default=None, exceptions=Exception):
+    """
+    Log exceptions raised by a method through its instance's logger
+    
+    Args:
+        message: Prefix for the error log entry
+        reraise: Whether to re-raise the exception after logging
+        default: Value returned when the exception is swallowed
+        exceptions: Exception type(s) to handle
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            except exceptions as e:
+                self.logger.error(f"{message}: {e}")
+                if reraise:
+                    raise
+                return default
+        return wrapper
+    return decorator
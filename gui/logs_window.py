@@ -5,14 +5,67 @@ Displays access logs and intrusion attempts with image preview
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime, timedelta
+import heapq
+import itertools
 import logging
-import threading
+import os
+import re
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from PIL import Image, ImageTk
-import cv2
 
 from managers.log_manager import LogManager
 
+# Fallback preview size used before the image canvas has been laid out
+DEFAULT_PREVIEW_SIZE = (800, 600)
+
+# Decoded evidence images and rendered PhotoImages kept for quick reselection
+IMAGE_CACHE_SIZE = 64
+PHOTO_CACHE_SIZE = 16
+
+# Only the visible log rows plus this many on each side exist as Treeview items
+LOG_WINDOW_BUFFER = 10
+# Approximate ttk.Treeview row height in pixels, used to size the window
+LOG_ROW_HEIGHT = 20
+
+# The zoom base image is pre-shrunk to this multiple of the canvas size
+ZOOM_BASE_HEADROOM = 2
+# Delay before a high-quality render replaces the fast zoom preview (ms)
+ZOOM_SETTLE_DELAY = 150
+# Quiet period after the last selection change before evidence is loaded (ms)
+SELECT_DEBOUNCE_DELAY = 150
+# Evidence files of rendered rows decoded ahead of selection after a refresh
+PREFETCH_LIMIT = 16
+
+# Write buffer for CSV export, so rows reach the file in few large writes
+EXPORT_BUFFER_SIZE = 1 << 20
+# CSV export columns
+EXPORT_COLUMNS = ["Timestamp", "Type", "User", "Action", "Details"]
+
+# Characters that make the csv module quote a field (QUOTE_MINIMAL)
+CSV_SPECIAL_RE = re.compile(r'[",\r\n]')
+
+# Action classification; branches are tried in order so CAMERA wins over
+# AUTH, which wins over SYSTEM/SETUP, wherever they appear in the action
+LOG_TYPE_RE = re.compile(
+    r'(?=.*(?P<Camera>CAMERA))|(?=.*(?P<Auth>AUTH))|(?=.*(?P<System>SYSTEM|SETUP))',
+    re.IGNORECASE | re.DOTALL
+)
+
+
+@lru_cache(maxsize=256)
+def classify_action(action):
+    """Display type for a log action; actions repeat, so results are cached"""
+    match = LOG_TYPE_RE.match(action)
+    return match.lastgroup if match else "Other"
+
+
+@lru_cache(maxsize=256)
+def format_user(user_id):
+    """User column text; few users act, so each string is built once"""
+    return f"User {user_id}" if user_id > 0 else "System"
+
 
 class LogsWindow:
     """Window for displaying system logs"""
@@ -23,27 +76,91 @@ class LogsWindow:
         self.log_manager = log_manager
         self.logger = logging.getLogger(__name__)
         
-        # Image cache for performance
-        self.image_cache = {}
+        # LRU caches: decoded images keyed by (path, mtime_ns), rendered
+        # PhotoImages keyed by (path, mtime_ns, width, height)
+        self.image_cache = OrderedDict()
+        self.photo_cache = OrderedDict()
         self.thumbnail_size = (100, 75)
         
+        # Shared workers for evidence decoding and log queries
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="logs-io")
+        # Bumped to abandon an in-flight evidence prefetch
+        self._prefetch_gen = 0
+        # Set once the window is closing; queued callbacks then do nothing
+        self._closed = False
+        
         # Create window
         self.window = tk.Toplevel(parent)
         self.window.title("🔍 System Logs & Intrusion Evidence")
         self.window.geometry("1200x800")
         self.window.transient(parent)
+        self.window.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        # Build the window hidden so Tk computes the layout once, not per widget
+        self.window.withdraw()
         
         # Center the window
         self.center_window()
         
         # Create widgets
         self.create_widgets()
+        self.window.update_idletasks()
+        self.window.deiconify()
         
         # Load initial logs asynchronously
         self.refresh_logs_async()
         
         self.logger.info("Enhanced logs window opened")
     
+    def _on_close(self):
+        """Hide the window, dropping in-flight work and decoded images"""
+        self._closed = True
+        self._prefetch_gen += 1
+        self._load_gen += 1
+        if self._pending_select_after:
+            self.window.after_cancel(self._pending_select_after)
+            self._pending_select_after = None
+        
+        # Release decoded images now rather than holding them while hidden
+        self.image_cache.clear()
+        self.photo_cache.clear()
+        self.clear_image_display()
+        self.window.withdraw()
+    
+    def show(self):
+        """Show the window again and refresh its logs"""
+        self._closed = False
+        self.window.deiconify()
+        self.window.lift()
+        self.window.focus_force()
+        self.refresh_logs_async()
+    
+    def destroy(self):
+        """Stop background work and destroy the window"""
+        self._closed = True
+        self._prefetch_gen += 1
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        try:
+            self.window.destroy()
+        except tk.TclError:
+            # Already destroyed along with the main window
+            pass
+    
+    def _post(self, callback):
+        """Run callback on the Tk thread unless the window has been closed"""
+        if self._closed:
+            return
+        
+        def run():
+            if not self._closed and self.window.winfo_exists():
+                callback()
+        
+        try:
+            self.window.after(0, run)
+        except (RuntimeError, tk.TclError):
+            # Tk is already gone
+            pass
+    
     def center_window(self):
         """Center the window on the screen"""
         self.window.update_idletasks()
@@ -77,17 +194,22 @@ class LogsWindow:
     
     def create_logs_panel(self, parent):
         """Create the logs display panel"""
+        # The panel is laid out with grid only; the log entries row takes extra space
+        parent.grid_rowconfigure(2, weight=1)
+        parent.grid_columnconfigure(0, weight=1)
+        
         # Title
         title_label = ttk.Label(parent, text="📋 System Activity Logs", font=("Segoe UI", 14, "bold"))
-        title_label.pack(pady=(0, 10))
+        title_label.grid(row=0, column=0, pady=(0, 10))
         
         # Filter frame
         filter_frame = ttk.LabelFrame(parent, text="🔍 Filters", padding="5")
-        filter_frame.pack(fill=tk.X, pady=(0, 10))
+        filter_frame.grid(row=1, column=0, sticky="ew", pady=(0, 10))
+        filter_frame.grid_columnconfigure(0, weight=1)
         
         # Filter controls
         filter_controls = ttk.Frame(filter_frame)
-        filter_controls.pack(fill=tk.X)
+        filter_controls.grid(row=0, column=0, sticky="ew")
         
         # Log type filter
         ttk.Label(filter_controls, text="Type:").grid(row=0, column=0, padx=(0, 5), sticky="w")
@@ -122,7 +244,7 @@ class LogsWindow:
         
         # Logs display frame
         logs_frame = ttk.LabelFrame(parent, text="📊 Log Entries", padding="5")
-        logs_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+        logs_frame.grid(row=2, column=0, sticky="nsew", pady=(0, 10))
         
         # Configure logs frame grid
         logs_frame.grid_rowconfigure(0, weight=1)
@@ -149,24 +271,46 @@ class LogsWindow:
         self.logs_tree.column("Evidence", width=80)
         
         # Scrollbars
-        v_scrollbar = ttk.Scrollbar(logs_frame, orient=tk.VERTICAL, command=self.logs_tree.yview)
-        h_scrollbar = ttk.Scrollbar(logs_frame, orient=tk.HORIZONTAL, command=self.logs_tree.xview)
-        self.logs_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        # The vertical scrollbar spans all logs, not just the rendered window
+        self.logs_v_scrollbar = ttk.Scrollbar(logs_frame, orient=tk.VERTICAL, command=self.on_logs_scrollbar)
+        self.logs_h_scrollbar = ttk.Scrollbar(logs_frame, orient=tk.HORIZONTAL, command=self.logs_tree.xview)
+        self.logs_tree.configure(
+            yscrollcommand=self.on_logs_tree_yview,
+            xscrollcommand=self.logs_h_scrollbar.set
+        )
+        
+        # Virtualized rows: full data set and the index of the top visible row
+        self._all_logs = []
+        self._all_rows = []
+        self._all_keys = []
+        # Key snapshot the statistics label was last computed for, and its text
+        self._stats_snapshot = None
+        self._stats_text = None
+        self._view_start = 0
+        self._window_range = (0, 0)
+        self._rerender_pending = False
+        
+        # Stable row keys mapped to the Treeview iids currently materialized
+        self._row_by_key = {}
+        self._next_row_id = 0
+        # Evidence file of each materialized row, looked up on selection
+        self._evidence_by_iid = {}
         
         # Pack treeview and scrollbars
         self.logs_tree.grid(row=0, column=0, sticky="nsew")
-        v_scrollbar.grid(row=0, column=1, sticky="ns")
-        h_scrollbar.grid(row=1, column=0, sticky="ew")
+        self.logs_v_scrollbar.grid(row=0, column=1, sticky="ns")
+        self.logs_h_scrollbar.grid(row=1, column=0, sticky="ew")
         
         # Bind selection event
         self.logs_tree.bind('<<TreeviewSelect>>', self.on_log_select)
         
         # Statistics frame
         stats_frame = ttk.LabelFrame(parent, text="📈 Statistics", padding="5")
-        stats_frame.pack(fill=tk.X)
+        stats_frame.grid(row=3, column=0, sticky="ew")
+        stats_frame.grid_columnconfigure(0, weight=1)
         
         self.stats_label = ttk.Label(stats_frame, text="Loading statistics...")
-        self.stats_label.pack()
+        self.stats_label.grid(row=0, column=0)
     
     def create_image_panel(self, parent):
         """Create the image preview panel"""
@@ -216,80 +360,204 @@ class LogsWindow:
         # Initialize image variables
         self.current_image = None
         self.current_image_path = None
+        self.current_image_key = None
+        self.zoom_base = None
         self.zoom_factor = 1.0
+        self._zoom_settle_id = None
+        
+        # Pending debounced selection and the generation of the latest load;
+        # results from older loads are dropped
+        self._pending_select_after = None
+        self._load_gen = 0
     
     def on_log_select(self, event):
-        """Handle log selection to show evidence"""
+        """Handle log selection, waiting for the selection to settle"""
+        if self._pending_select_after:
+            self.window.after_cancel(self._pending_select_after)
+        self._pending_select_after = self.window.after(SELECT_DEBOUNCE_DELAY, self._do_select)
+    
+    def _do_select(self):
+        """Show evidence for the selected log"""
+        self._pending_select_after = None
         selection = self.logs_tree.selection()
         if not selection:
             self.clear_image_display()
             return
         
-        item = self.logs_tree.item(selection[0])
-        values = item['values']
-        
-        # Check if this is an intrusion log with evidence
-        if len(values) >= 6 and values[5] and values[5] not in ["", "❌ Missing"]:
-            # For intrusion logs, we need to get the actual file path
-            # Since we can't store it directly in the tree, we'll reconstruct it
-            if values[1] == 'Intrusion':  # Type column
-                # Get intrusion logs and find matching one
-                intrusion_logs = self.log_manager.get_intrusion_logs()
-                timestamp_str = values[0]  # Time column
-                
-                # Find matching intrusion log
-                for intrusion in intrusion_logs:
-                    log_time = intrusion.timestamp.strftime("%m-%d %H:%M")
-                    if log_time == timestamp_str:
-                        self.load_evidence_async(intrusion.media_path, values)
-                        return
-            
+        values = self.logs_tree.item(selection[0], 'values')
+        
+        # Show evidence if the selected log has a file that still exists
+        evidence_path = self._evidence_by_iid.get(selection[0])
+        if evidence_path and len(values) >= 6 and values[5] not in ["", "❌ Missing"]:
+            self.load_evidence_async(evidence_path, values)
+            return
+        
         self.clear_image_display()
     
     def load_evidence_async(self, evidence_path, log_values):
         """Load evidence image asynchronously"""
+        # Read the canvas size on the Tk thread; video frames are shrunk to it
+        canvas_width = self.image_canvas.winfo_width()
+        canvas_height = self.image_canvas.winfo_height()
+        if canvas_width <= 1 or canvas_height <= 1:
+            canvas_width, canvas_height = DEFAULT_PREVIEW_SIZE
+        
+        # Reselecting an already decoded file skips the worker entirely
+        cache_key = None
+        if evidence_path and evidence_path != "None":
+            try:
+                cache_key = (evidence_path, os.stat(evidence_path).st_mtime_ns)
+            except OSError:
+                cache_key = None
+        self._load_gen += 1
+        gen = self._load_gen
+        
+        cached_image = self._cache_get(self.image_cache, cache_key)
+        if cached_image is not None:
+            self.display_image(cached_image, evidence_path, log_values, cache_key, gen)
+            return
+        
+        def deliver(callback):
+            # Run on the Tk thread unless a newer load has started since
+            self._post(lambda: callback() if gen == self._load_gen else None)
+        
         def load_image():
+            if gen != self._load_gen:
+                return
             try:
                 if evidence_path and evidence_path != "None":
                     # Update UI to show loading
-                    self.image_info_label.config(text="🔄 Loading evidence...")
+                    deliver(lambda: self.image_info_label.config(text="🔄 Loading evidence..."))
                     
                     # Load image
                     image_path = Path(evidence_path)
                     if image_path.exists():
-                        # Load image based on file type
-                        if evidence_path.lower().endswith(('.mp4', '.avi', '.mov')):
-                            # Extract frame from video
-                            image = self.extract_video_frame(evidence_path)
-                        else:
-                            # Load image file
-                            image = Image.open(evidence_path)
+                        image = self.decode_evidence(evidence_path, (canvas_width, canvas_height))
                         
+                        if gen != self._load_gen:
+                            # A newer selection superseded this decode
+                            return
                         if image:
-                            # Update UI in main thread
-                            self.window.after(0, lambda: self.display_image(image, evidence_path, log_values))
+                            # Update UI in main thread; each load hands its image over
+                            # through its own slot, emptied once it has been displayed
+                            slot = [image]
+                            deliver(lambda: self.display_image(
+                                slot.pop(), evidence_path, log_values, cache_key, gen
+                            ))
                         else:
-                            self.window.after(0, lambda: self.show_image_error("Could not load image"))
+                            deliver(lambda: self.show_image_error("Could not load image"))
                     else:
-                        self.window.after(0, lambda: self.show_image_error("Evidence file not found"))
+                        deliver(lambda: self.show_image_error("Evidence file not found"))
                 else:
-                    self.window.after(0, self.clear_image_display)
+                    deliver(self.clear_image_display)
                     
             except Exception as e:
                 self.logger.error(f"Error loading evidence: {e}")
-                self.window.after(0, lambda: self.show_image_error(f"Error: {e}"))
+                deliver(lambda error=e: self.show_image_error(f"Error: {error}"))
         
         # Run in background thread
-        threading.Thread(target=load_image, daemon=True).start()
+        self._io_pool.submit(load_image)
+    
+    def decode_evidence(self, evidence_path, max_size):
+        """Decode an evidence file for preview based on its type"""
+        if evidence_path.lower().endswith(('.mp4', '.avi', '.mov')):
+            # Extract frame from video
+            return self.extract_video_frame(evidence_path, max_size)
+        return self.load_still_image(evidence_path)
+    
+    def prefetch_evidence(self):
+        """Decode evidence of the rendered rows in the background ahead of selection"""
+        first, last = self._window_range
+        paths = []
+        for log in self._all_logs[first:last]:
+            path = log.get('evidence_path')
+            if path and path not in paths:
+                paths.append(path)
+        paths = paths[:PREFETCH_LIMIT]
+        if not paths:
+            return
+        
+        canvas_size = (self.image_canvas.winfo_width(), self.image_canvas.winfo_height())
+        if canvas_size[0] <= 1 or canvas_size[1] <= 1:
+            canvas_size = DEFAULT_PREVIEW_SIZE
+        
+        self._prefetch_gen += 1
+        gen = self._prefetch_gen
+        
+        def prefetch():
+            # Runs on a single pool worker so selections always have one free
+            for path in paths:
+                if gen != self._prefetch_gen:
+                    return
+                try:
+                    cache_key = (path, os.stat(path).st_mtime_ns)
+                    if cache_key in self.image_cache:
+                        continue
+                    image = self.decode_evidence(path, canvas_size)
+                except Exception as e:
+                    self.logger.debug(f"Skipping evidence prefetch for {path}: {e}")
+                    continue
+                if image is not None and gen == self._prefetch_gen:
+                    # The cache is only touched from the Tk thread
+                    self._post(lambda key=cache_key, image=image: self._cache_put(
+                        self.image_cache, key, image, IMAGE_CACHE_SIZE
+                    ))
+        
+        self._io_pool.submit(prefetch)
+    
+    def load_still_image(self, image_path):
+        """Decode a still image with OpenCV, falling back to PIL"""
+        import cv2
+        import numpy as np
+        from PIL import Image
+        
+        try:
+            with open(image_path, 'rb') as f:
+                buffer = np.frombuffer(f.read(), np.uint8)
+            frame = cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+            if frame is not None:
+                # OpenCV decodes to BGR; PIL/Tk expect RGB
+                return Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        except Exception as e:
+            self.logger.warning(f"OpenCV decode failed, using PIL: {e}")
+        
+        return Image.open(image_path)
     
-    def extract_video_frame(self, video_path):
-        """Extract first frame from video file"""
+    def extract_video_frame(self, video_path, max_size=None):
+        """
+        Extract a representative frame (~10% into the clip) from video file
+        
+        Args:
+            video_path: Path to the video file
+            max_size: Optional (width, height) the frame is shrunk to fit
+        """
+        import cv2
+        from PIL import Image
+        
         try:
             cap = cv2.VideoCapture(video_path)
-            ret, frame = cap.read()
-            cap.release()
+            try:
+                # Seek past dark intro frames, then decode only the frame we need
+                total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+                cap.set(cv2.CAP_PROP_POS_FRAMES, max(0, total_frames // 10))
+                ret = cap.grab()
+                if ret:
+                    ret, frame = cap.retrieve()
+            finally:
+                cap.release()
             
             if ret:
+                # Shrink in OpenCV before handing the frame to PIL
+                if max_size:
+                    frame_height, frame_width = frame.shape[:2]
+                    scale = min(max_size[0] / frame_width, max_size[1] / frame_height)
+                    if scale < 1.0:
+                        frame = cv2.resize(
+                            frame,
+                            (max(1, int(frame_width * scale)), max(1, int(frame_height * scale))),
+                            interpolation=cv2.INTER_AREA
+                        )
+                
                 # Convert BGR to RGB
                 frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
                 return Image.fromarray(frame_rgb)
@@ -299,12 +567,59 @@ class LogsWindow:
             self.logger.error(f"Error extracting video frame: {e}")
             return None
     
-    def display_image(self, image, image_path, log_values):
+    def _cache_get(self, cache, key):
+        """Return a cached value and mark it most recently used"""
+        if key is None or key not in cache:
+            return None
+        cache.move_to_end(key)
+        return cache[key]
+    
+    def _cache_put(self, cache, key, value, max_size):
+        """Store a value, evicting the least recently used entries"""
+        if key is None:
+            return
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+    
+    def _get_photo(self, image, size):
+        """Return a PhotoImage of the current image at size, reusing cached renders"""
+        import cv2
+        
+        photo_key = self.current_image_key + size if self.current_image_key else None
+        photo = self._cache_get(self.photo_cache, photo_key)
+        if photo is None:
+            # Area averaging when shrinking, bicubic when enlarging
+            shrinking = size[0] <= image.size[0]
+            photo = self._render_photo(image, size, cv2.INTER_AREA if shrinking else cv2.INTER_CUBIC)
+            self._cache_put(self.photo_cache, photo_key, photo, PHOTO_CACHE_SIZE)
+        return photo
+    
+    def _render_photo(self, image, size, interpolation):
+        """Resize with OpenCV and hand the pixels to Tk as PPM, bypassing ImageTk"""
+        import cv2
+        import numpy as np
+        
+        pixels = np.asarray(image if image.mode == "RGB" else image.convert("RGB"))
+        if (pixels.shape[1], pixels.shape[0]) != size:
+            pixels = cv2.resize(pixels, size, interpolation=interpolation)
+        header = f"P6 {size[0]} {size[1]} 255\n".encode()
+        return tk.PhotoImage(master=self.image_canvas, data=header + pixels.tobytes())
+    
+    def display_image(self, image, image_path, log_values, cache_key=None, gen=None):
         """Display image in the canvas"""
+        from PIL import Image
+        
+        if self._closed or image is None or (gen is not None and gen != self._load_gen):
+            return
         try:
             self.current_image = image
             self.current_image_path = image_path
+            self.current_image_key = cache_key
             self.zoom_factor = 1.0
+            self._cancel_zoom_settle()
+            self._cache_put(self.image_cache, cache_key, image, IMAGE_CACHE_SIZE)
             
             # Calculate display size
             canvas_width = self.image_canvas.winfo_width()
@@ -312,7 +627,7 @@ class LogsWindow:
             
             if canvas_width <= 1 or canvas_height <= 1:
                 # Canvas not ready, try again later
-                self.window.after(100, lambda: self.display_image(image, image_path, log_values))
+                self.window.after(100, lambda: self.display_image(image, image_path, log_values, cache_key, gen))
                 return
             
             # Resize image to fit canvas while maintaining aspect ratio
@@ -322,8 +637,23 @@ class LogsWindow:
             new_width = int(img_width * scale)
             new_height = int(img_height * scale)
             
-            display_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            self.photo = ImageTk.PhotoImage(display_image)
+            # Shrink once to the canvas size plus headroom; zooming works from this
+            # copy and the full image is only needed for saving
+            base_scale = min(
+                ZOOM_BASE_HEADROOM * canvas_width / img_width,
+                ZOOM_BASE_HEADROOM * canvas_height / img_height,
+                1.0
+            )
+            if base_scale < 1.0:
+                self.zoom_base = image.resize(
+                    (max(1, int(img_width * base_scale)), max(1, int(img_height * base_scale))),
+                    Image.Resampling.LANCZOS
+                )
+            else:
+                self.zoom_base = image
+            
+            # Images that already fit (e.g. pre-shrunk video frames) are shown as-is
+            self.photo = self._get_photo(self.zoom_base, (new_width, new_height))
             
             # Clear canvas and display image
             self.image_canvas.delete("all")
@@ -332,12 +662,15 @@ class LogsWindow:
                 image=self.photo, anchor=tk.CENTER
             )
             
-            # Update scroll region
-            self.image_canvas.configure(scrollregion=self.image_canvas.bbox("all"))
+            # The fitted image lies inside the canvas, so nothing scrolls
+            self.image_canvas.configure(scrollregion=(0, 0, canvas_width, canvas_height))
             
             # Update info label
             timestamp = log_values[0] if len(log_values) > 0 else "Unknown"
-            file_size = Path(image_path).stat().st_size if Path(image_path).exists() else 0
+            try:
+                file_size = os.stat(image_path).st_size
+            except OSError:
+                file_size = 0
             info_text = f"📅 {timestamp} | 📏 {img_width}x{img_height} | 💾 {file_size // 1024}KB"
             self.image_info_label.config(text=info_text, foreground="black")
             
@@ -352,6 +685,8 @@ class LogsWindow:
     
     def clear_image_display(self):
         """Clear the image display"""
+        # Invalidate any evidence load still in flight
+        self._load_gen += 1
         self.image_canvas.delete("all")
         self.image_info_label.config(text="Select an intrusion log to view evidence", foreground="gray")
         self.zoom_in_btn.config(state="disabled")
@@ -359,6 +694,9 @@ class LogsWindow:
         self.save_btn.config(state="disabled")
         self.current_image = None
         self.current_image_path = None
+        self.current_image_key = None
+        self.zoom_base = None
+        self._cancel_zoom_settle()
     
     def show_image_error(self, error_msg):
         """Show error message in image panel"""
@@ -384,26 +722,50 @@ class LogsWindow:
             self.zoom_factor /= 1.2
             self.update_image_zoom()
     
-    def update_image_zoom(self):
-        """Update image display with current zoom factor"""
-        if not self.current_image:
+    def update_image_zoom(self, final=False):
+        """
+        Update image display with current zoom factor
+        
+        Interactive steps use a fast bilinear resize of the zoom base; a
+        high-quality render replaces it once zooming has settled.
+        """
+        import cv2
+        
+        if final:
+            self._zoom_settle_id = None
+        if not self.current_image or not self.zoom_base:
             return
         
         try:
             img_width, img_height = self.current_image.size
-            new_width = int(img_width * self.zoom_factor)
-            new_height = int(img_height * self.zoom_factor)
+            size = (max(1, int(img_width * self.zoom_factor)), max(1, int(img_height * self.zoom_factor)))
             
-            display_image = self.current_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            self.photo = ImageTk.PhotoImage(display_image)
+            photo_key = self.current_image_key + size if self.current_image_key else None
+            photo = self._cache_get(self.photo_cache, photo_key)
+            if photo is None:
+                if final:
+                    photo = self._get_photo(self.zoom_base, size)
+                else:
+                    photo = self._render_photo(self.zoom_base, size, cv2.INTER_LINEAR)
+                    self._cancel_zoom_settle()
+                    self._zoom_settle_id = self.window.after(
+                        ZOOM_SETTLE_DELAY, lambda: self.update_image_zoom(final=True)
+                    )
+            self.photo = photo
             
             self.image_canvas.delete("all")
             self.image_canvas.create_image(0, 0, image=self.photo, anchor=tk.NW)
-            self.image_canvas.configure(scrollregion=self.image_canvas.bbox("all"))
+            self.image_canvas.configure(scrollregion=(0, 0) + size)
             
         except Exception as e:
             self.logger.error(f"Error updating zoom: {e}")
     
+    def _cancel_zoom_settle(self):
+        """Cancel a pending high-quality zoom render"""
+        if self._zoom_settle_id:
+            self.window.after_cancel(self._zoom_settle_id)
+            self._zoom_settle_id = None
+    
     def save_image(self):
         """Save the current image"""
         if not self.current_image_path:
@@ -425,8 +787,9 @@ class LogsWindow:
             
             if filename:
                 if self.current_image_path.lower().endswith(('.mp4', '.avi', '.mov')):
-                    # Save extracted frame
-                    self.current_image.save(filename)
+                    # Save the frame at full resolution, not the shrunk preview
+                    frame = self.extract_video_frame(self.current_image_path) or self.current_image
+                    self.write_frame(frame, filename)
                 else:
                     # Copy original image
                     import shutil
@@ -437,106 +800,37 @@ class LogsWindow:
         except Exception as e:
             self.logger.error(f"Error saving image: {e}")
             messagebox.showerror("Error", f"Failed to save image: {e}")
+    
+    def write_frame(self, frame, filename):
+        """Encode a frame to filename, using OpenCV's faster encoders where possible"""
+        import cv2
+        import numpy as np
+        
+        extension = Path(filename).suffix.lower()
+        params = {
+            '.jpg': [cv2.IMWRITE_JPEG_QUALITY, 92],
+            '.jpeg': [cv2.IMWRITE_JPEG_QUALITY, 92],
+            '.png': [cv2.IMWRITE_PNG_COMPRESSION, 3],
+        }.get(extension)
+        if params is None:
+            frame.save(filename)
+            return
         
-        # Title
-        title_label = ttk.Label(main_frame, text="System Logs", font=("Arial", 14, "bold"))
-        title_label.pack(pady=(0, 10))
-        
-        # Filter frame
-        filter_frame = ttk.LabelFrame(main_frame, text="Filters", padding="5")
-        filter_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        # Log type filter
-        ttk.Label(filter_frame, text="Log Type:").grid(row=0, column=0, padx=(0, 5))
-        self.log_type_var = tk.StringVar(value="All")
-        log_type_combo = ttk.Combobox(
-            filter_frame, 
-            textvariable=self.log_type_var,
-            values=["All", "Camera Access", "Authentication", "Intrusion Attempts", "System Events"],
-            state="readonly",
-            width=15
-        )
-        log_type_combo.grid(row=0, column=1, padx=(0, 10))
-        
-        # Date range filter
-        ttk.Label(filter_frame, text="Date Range:").grid(row=0, column=2, padx=(0, 5))
-        self.date_range_var = tk.StringVar(value="Last 7 days")
-        date_range_combo = ttk.Combobox(
-            filter_frame,
-            textvariable=self.date_range_var,
-            values=["Last 24 hours", "Last 7 days", "Last 30 days", "All time"],
-            state="readonly",
-            width=15
-        )
-        date_range_combo.grid(row=0, column=3, padx=(0, 10))
-        
-        # Refresh button
-        refresh_btn = ttk.Button(filter_frame, text="Refresh", command=self.refresh_logs)
-        refresh_btn.grid(row=0, column=4, padx=(10, 0))
-        
-        # Export button
-        export_btn = ttk.Button(filter_frame, text="Export", command=self.export_logs)
-        export_btn.grid(row=0, column=5, padx=(5, 0))
-        
-        # Logs display frame
-        logs_frame = ttk.LabelFrame(main_frame, text="Log Entries", padding="5")
-        logs_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
-        
-        # Create treeview for logs
-        columns = ("Timestamp", "Type", "User", "Action", "Details")
-        self.logs_tree = ttk.Treeview(logs_frame, columns=columns, show="headings", height=20)
-        
-        # Configure columns
-        self.logs_tree.heading("Timestamp", text="Timestamp")
-        self.logs_tree.heading("Type", text="Type")
-        self.logs_tree.heading("User", text="User")
-        self.logs_tree.heading("Action", text="Action")
-        self.logs_tree.heading("Details", text="Details")
-        
-        self.logs_tree.column("Timestamp", width=150)
-        self.logs_tree.column("Type", width=100)
-        self.logs_tree.column("User", width=80)
-        self.logs_tree.column("Action", width=150)
-        self.logs_tree.column("Details", width=300)
-        
-        # Scrollbars
-        v_scrollbar = ttk.Scrollbar(logs_frame, orient=tk.VERTICAL, command=self.logs_tree.yview)
-        h_scrollbar = ttk.Scrollbar(logs_frame, orient=tk.HORIZONTAL, command=self.logs_tree.xview)
-        self.logs_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-        
-        # Pack treeview and scrollbars
-        self.logs_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        v_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        h_scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
-        
-        # Configure grid weights
-        logs_frame.grid_rowconfigure(0, weight=1)
-        logs_frame.grid_columnconfigure(0, weight=1)
-        
-        # Statistics frame
-        stats_frame = ttk.LabelFrame(main_frame, text="Statistics", padding="5")
-        stats_frame.pack(fill=tk.X)
-        
-        self.stats_label = ttk.Label(stats_frame, text="Loading statistics...")
-        self.stats_label.pack()
-        
-        # Close button
-        close_btn = ttk.Button(main_frame, text="Close", command=self.window.destroy)
-        close_btn.pack(pady=(10, 0))
+        bgr = cv2.cvtColor(np.asarray(frame.convert("RGB")), cv2.COLOR_RGB2BGR)
+        ok, encoded = cv2.imencode(extension, bgr, params)
+        if not ok:
+            raise ValueError(f"Could not encode frame as {extension}")
+        with open(filename, 'wb') as f:
+            f.write(encoded.tobytes())
     
     def refresh_logs(self):
         """Refresh the logs display"""
         try:
-            # Clear existing items
-            for item in self.logs_tree.get_children():
-                self.logs_tree.delete(item)
-            
             # Get filtered logs
-            logs = self.get_filtered_logs()
+            logs = self.get_filtered_logs(*self.get_current_filters())
             
             # Populate treeview
-            for log in logs:
-                self.add_log_to_tree(log)
+            self.populate_tree(logs, self.format_log_rows(logs))
             
             # Update statistics
             self.update_statistics(logs)
@@ -547,208 +841,339 @@ class LogsWindow:
             self.logger.error(f"Error refreshing logs: {e}")
             messagebox.showerror("Error", f"Failed to refresh logs: {e}")
     
-    def get_filtered_logs(self):
-        """Get logs based on current filters"""
+    def get_current_filters(self):
+        """
+        Read the selected (log type, date range) filters
+        
+        Tk variables are not thread-safe, so this runs on the Tk thread and the
+        values are handed to background queries.
+        """
+        return self.log_type_var.get(), self.date_range_var.get()
+    
+    def get_filtered_logs(self, log_type, date_range):
+        """Get logs matching the given filters"""
         try:
-            # Get date range
-            end_date = datetime.now()
-            date_range = self.date_range_var.get()
-            
-            if date_range == "Last 24 hours":
-                start_date = end_date - timedelta(days=1)
-            elif date_range == "Last 7 days":
-                start_date = end_date - timedelta(days=7)
-            elif date_range == "Last 30 days":
-                start_date = end_date - timedelta(days=30)
-            else:  # All time
-                start_date = datetime(2000, 1, 1)  # Very old date
-            
-            # Get logs by date range
-            access_logs = self.log_manager.get_logs_by_date_range(start_date, end_date)
-            
-            # Filter by log type
-            log_type = self.log_type_var.get()
-            if log_type != "All":
-                filtered_logs = []
-                for log in access_logs:
-                    if self.matches_log_type(log, log_type):
-                        filtered_logs.append(log)
-                access_logs = filtered_logs
-            
-            # Also get intrusion logs if requested
-            intrusion_logs = []
-            if log_type in ["All", "Intrusion Attempts"]:
-                all_intrusions = self.log_manager.get_intrusion_logs()
-                intrusion_logs = [
-                    intrusion for intrusion in all_intrusions
-                    if start_date <= intrusion.timestamp <= end_date
-                ]
-            
-            # Combine and sort logs
-            combined_logs = []
-            
-            # Add access logs
-            for log in access_logs:
-                combined_logs.append({
-                    'timestamp': log.timestamp,
-                    'type': self.get_log_type_display(log.action),
-                    'user_id': log.user_id,
-                    'action': log.action,
-                    'details': '',
-                    'evidence_path': None
-                })
-            
-            # Add intrusion logs with evidence paths
-            for intrusion in intrusion_logs:
-                combined_logs.append({
-                    'timestamp': intrusion.timestamp,
-                    'type': 'Intrusion',
-                    'user_id': -1,
-                    'action': 'INTRUSION_DETECTED',
-                    'details': f"Evidence captured",
-                    'evidence_path': intrusion.media_path
-                })
-            
-            # Sort by timestamp (newest first)
-            combined_logs.sort(key=lambda x: x['timestamp'], reverse=True)
-            
-            return combined_logs
+            return list(self.iter_filtered_logs(log_type, date_range))
             
         except Exception as e:
             self.logger.error(f"Error getting filtered logs: {e}")
             return []
     
-    def matches_log_type(self, log, log_type):
-        """Check if log matches the selected log type"""
-        action = log.action.upper()
+    def iter_filtered_logs(self, log_type, date_range, limit=1000):
+        """Iterate logs matching the given filters, newest first"""
+        # Get date range
+        end_date = datetime.now()
+        
+        if date_range == "Last 24 hours":
+            start_date = end_date - timedelta(days=1)
+        elif date_range == "Last 7 days":
+            start_date = end_date - timedelta(days=7)
+        elif date_range == "Last 30 days":
+            start_date = end_date - timedelta(days=30)
+        else:  # All time
+            start_date = None
+        
+        # Date and type filtering and ordering happen in the database
+        access_logs = self.log_manager.get_logs(start_date, end_date, log_type, limit=limit)
+        
+        intrusion_logs = []
+        if log_type in ["All", "Intrusion Attempts"]:
+            intrusion_logs = self.log_manager.get_intrusion_logs(
+                limit=limit, start_date=start_date, end_date=end_date
+            )
+        
+        access_entries = (
+            {
+                'timestamp': log.timestamp,
+                'type': self.get_log_type_display(log.action),
+                'user_id': log.user_id,
+                'action': log.action,
+                'details': '',
+                'evidence_path': None
+            }
+            for log in access_logs
+        )
         
-        if log_type == "Camera Access":
-            return "CAMERA" in action
-        elif log_type == "Authentication":
-            return "AUTH" in action
-        elif log_type == "System Events":
-            return "SYSTEM" in action or "SETUP" in action
+        # Add intrusion logs with evidence paths
+        intrusion_entries = (
+            {
+                'timestamp': intrusion.timestamp,
+                'type': 'Intrusion',
+                'user_id': -1,
+                'action': 'INTRUSION_DETECTED',
+                'details': f"Evidence captured",
+                'evidence_path': intrusion.media_path
+            }
+            for intrusion in intrusion_logs
+        )
         
-        return True
+        # Both lists are already newest first; merge instead of re-sorting
+        return heapq.merge(
+            access_entries, intrusion_entries,
+            key=lambda x: x['timestamp'], reverse=True
+        )
     
     def get_log_type_display(self, action):
         """Get display-friendly log type from action"""
-        action = action.upper()
-        
-        if "CAMERA" in action:
-            return "Camera"
-        elif "AUTH" in action:
-            return "Auth"
-        elif "SYSTEM" in action or "SETUP" in action:
-            return "System"
-        else:
-            return "Other"
-    
-    def add_log_to_tree(self, log):
-        """Add a log entry to the treeview with evidence support"""
+        return classify_action(action)
+    
+    @staticmethod
+    def format_timestamps(logs):
+        """Format log timestamps for the Time column ("%m-%d %H:%M")"""
+        fmt = datetime.strftime
+        return [fmt(log['timestamp'], "%m-%d %H:%M") for log in logs]
+    
+    def format_log_rows(self, logs):
+        """Build the treeview values for a batch of log entries"""
+        format_row = self.format_log_row
+        # Each evidence file is stat'ed once per refresh, however many rows share it
+        statuses = {}
+        rows = []
+        for log, timestamp_str in zip(logs, self.format_timestamps(logs)):
+            path = log.get('evidence_path')
+            if path and path not in statuses:
+                statuses[path] = self.get_evidence_status(path)
+            rows.append(format_row(log, timestamp_str, statuses.get(path, "")))
+        return rows
+    
+    @staticmethod
+    def get_evidence_status(evidence_path):
+        """Evidence column text for a file, with a single stat call"""
+        if not evidence_path:
+            return ""
         try:
+            os.stat(evidence_path)
+        except OSError:
+            return "❌ Missing"
+        if os.path.splitext(evidence_path)[1].lower() in ('.mp4', '.avi', '.mov'):
+            return "🎥 Video"
+        return "📷 Photo"
+    
+    def format_log_row(self, log, timestamp_str=None, evidence_status=None):
+        """Build the treeview values for a log entry"""
+        if timestamp_str is None:
             timestamp_str = log['timestamp'].strftime("%m-%d %H:%M")
-            user_str = f"User {log['user_id']}" if log['user_id'] > 0 else "System"
-            
-            # Determine evidence status
-            evidence_status = ""
-            if log.get('evidence_path'):
-                evidence_path = Path(log['evidence_path'])
-                if evidence_path.exists():
-                    if evidence_path.suffix.lower() in ['.mp4', '.avi', '.mov']:
-                        evidence_status = "🎥 Video"
-                    else:
-                        evidence_status = "📷 Photo"
-                else:
-                    evidence_status = "❌ Missing"
-            
-            # Add color coding for intrusion logs
-            item_id = self.logs_tree.insert("", tk.END, values=(
-                timestamp_str,
-                log['type'],
-                user_str,
-                log['action'],
-                log['details'],
-                evidence_status
-            ))
+        if evidence_status is None:
+            evidence_status = self.get_evidence_status(log.get('evidence_path'))
+        user_str = format_user(log['user_id'])
+        
+        return (
+            timestamp_str,
+            log['type'],
+            user_str,
+            log['action'],
+            log['details'],
+            evidence_status
+        )
+    
+    def add_log_to_tree(self, log, values=None, index=tk.END, iid=None):
+        """Add a log entry to the treeview with evidence support"""
+        try:
+            if values is None:
+                values = self.format_log_row(log)
             
             # Color code intrusion attempts
-            if log['type'] == 'Intrusion':
-                self.logs_tree.item(item_id, tags=('intrusion',))
-            
-            # Store evidence path in item for later retrieval
+            tags = ('intrusion',) if log['type'] == 'Intrusion' else ()
+            iid = self.logs_tree.insert("", index, iid=iid, values=values, tags=tags)
             if log.get('evidence_path'):
-                # Store the evidence path as a hidden value
-                current_values = list(self.logs_tree.item(item_id)['values'])
-                current_values.append(log['evidence_path'])  # Hidden evidence path
-                
+                self._evidence_by_iid[iid] = log['evidence_path']
+            
         except Exception as e:
             self.logger.error(f"Error adding log to tree: {e}")
     
+    @staticmethod
+    def _log_keys(logs, rows):
+        """Stable keys identifying each log row across refreshes"""
+        seen = {}
+        keys = []
+        for log, row in zip(logs, rows):
+            base = (log['timestamp'], log['type'], log['action'], log['user_id'], row)
+            # Identical entries logged in the same instant still need distinct keys
+            occurrence = seen.get(base, 0)
+            seen[base] = occurrence + 1
+            keys.append(base + (occurrence,))
+        return keys
+    
+    def populate_tree(self, logs, rows):
+        """Update the logs shown in the treeview, touching only rows that changed"""
+        keys = self._log_keys(logs, rows)
+        if keys == self._all_keys:
+            return
+        
+        # Keep the same log at the top of the view if it is still present
+        top_key = self._all_keys[self._view_start] if self._view_start < len(self._all_keys) else None
+        self._all_logs = logs
+        self._all_rows = rows
+        self._all_keys = keys
+        try:
+            self._view_start = keys.index(top_key)
+        except ValueError:
+            self._view_start = 0
+        self.render_log_window(repopulate=True)
+    
+    def _visible_row_count(self):
+        """Number of rows that fit in the treeview"""
+        return max(int(self.logs_tree.cget("height")), self.logs_tree.winfo_height() // LOG_ROW_HEIGHT)
+    
+    def render_log_window(self, repopulate=False):
+        """
+        Materialize only the rows around the current view as Treeview items
+        
+        Args:
+            repopulate: The data set was replaced, so most rows may change
+        """
+        self._rerender_pending = False
+        total = len(self._all_logs)
+        visible = self._visible_row_count()
+        self._view_start = max(0, min(self._view_start, total - visible))
+        
+        first = max(0, self._view_start - LOG_WINDOW_BUFFER)
+        last = min(total, self._view_start + visible + LOG_WINDOW_BUFFER)
+        wanted = self._all_keys[first:last]
+        
+        # For a new data set, unhook scrollbars and hide the tree so Tk doesn't
+        # relayout per row; scrolling only shifts a few rows and stays attached
+        if repopulate:
+            self.logs_tree.configure(yscrollcommand='', xscrollcommand='')
+            self.logs_tree.grid_remove()
+        try:
+            # Drop rows that left the window or the data set, add the ones that
+            # entered it and move survivors into place
+            wanted_keys = set(wanted)
+            stale = [key for key in self._row_by_key if key not in wanted_keys]
+            if stale:
+                stale_iids = [self._row_by_key.pop(key) for key in stale]
+                for iid in stale_iids:
+                    self._evidence_by_iid.pop(iid, None)
+                self.logs_tree.delete(*stale_iids)
+            for position, key in enumerate(wanted):
+                iid = self._row_by_key.get(key)
+                if iid is None:
+                    iid = f"log{self._next_row_id}"
+                    self._next_row_id += 1
+                    self._row_by_key[key] = iid
+                    self.add_log_to_tree(self._all_logs[first + position], self._all_rows[first + position], position, iid)
+                elif self.logs_tree.index(iid) != position:
+                    self.logs_tree.move(iid, '', position)
+            self._window_range = (first, last)
+        finally:
+            if repopulate:
+                self.logs_tree.configure(
+                    yscrollcommand=self.on_logs_tree_yview,
+                    xscrollcommand=self.logs_h_scrollbar.set
+                )
+                self.logs_tree.grid()
+        
+        if last > first:
+            self.logs_tree.yview_moveto((self._view_start - first) / (last - first))
+        self._update_logs_scrollbar()
+    
+    def _update_logs_scrollbar(self):
+        """Position the scrollbar relative to the full log list"""
+        total = len(self._all_logs)
+        if not total:
+            self.logs_v_scrollbar.set(0.0, 1.0)
+            return
+        visible = self._visible_row_count()
+        self.logs_v_scrollbar.set(self._view_start / total, min(1.0, (self._view_start + visible) / total))
+    
+    def on_logs_scrollbar(self, *args):
+        """Scroll the virtualized log list from the scrollbar"""
+        total = len(self._all_logs)
+        visible = self._visible_row_count()
+        if args[0] == "moveto":
+            self._view_start = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = int(args[1])
+            self._view_start += step * visible if args[2] == "pages" else step
+        self.render_log_window()
+    
+    def on_logs_tree_yview(self, first_fraction, last_fraction):
+        """Track native tree scrolling (wheel, keyboard) within the rendered window"""
+        first, last = self._window_range
+        if last <= first:
+            return
+        self._view_start = first + int(round(float(first_fraction) * (last - first)))
+        self._update_logs_scrollbar()
+        
+        # Slide the window before the view runs off either end of it
+        visible = self._visible_row_count()
+        near_top = first > 0 and self._view_start - first < LOG_WINDOW_BUFFER // 2
+        near_bottom = last < len(self._all_logs) and last - (self._view_start + visible) < LOG_WINDOW_BUFFER // 2
+        if (near_top or near_bottom) and not self._rerender_pending:
+            self._rerender_pending = True
+            self.window.after_idle(self.render_log_window)
+    
     def refresh_logs_async(self):
         """Refresh logs asynchronously for better performance"""
+        filters = self.get_current_filters()
+        
         def refresh_in_background():
             try:
                 # Show loading state
-                self.window.after(0, lambda: self.stats_label.config(text="🔄 Loading logs..."))
+                self._post(lambda: self.stats_label.config(text="🔄 Loading logs..."))
                 
-                # Get logs in background
-                logs = self.get_filtered_logs()
+                # Get logs and format rows in background
+                logs = self.get_filtered_logs(*filters)
+                rows = self.format_log_rows(logs)
                 
                 # Update UI in main thread
                 def update_ui():
                     try:
-                        # Clear existing items
-                        for item in self.logs_tree.get_children():
-                            self.logs_tree.delete(item)
-                        
                         # Configure tags for styling
                         self.logs_tree.tag_configure('intrusion', background='#ffebee', foreground='#c62828')
                         
                         # Populate treeview
-                        for log in logs:
-                            self.add_log_to_tree(log)
+                        self.populate_tree(logs, rows)
                         
                         # Update statistics
                         self.update_statistics(logs)
                         
+                        # Warm the image cache for rows the user is likely to open
+                        self.prefetch_evidence()
+                        
                         self.logger.info(f"Refreshed logs display with {len(logs)} entries")
                         
                     except Exception as e:
                         self.logger.error(f"Error updating logs UI: {e}")
                         self.stats_label.config(text=f"❌ Error loading logs: {e}")
                 
-                self.window.after(0, update_ui)
+                self._post(update_ui)
                 
             except Exception as e:
                 self.logger.error(f"Error refreshing logs: {e}")
-                self.window.after(0, lambda: self.stats_label.config(text=f"❌ Error: {e}"))
+                self._post(lambda error=e: self.stats_label.config(text=f"❌ Error: {error}"))
         
         # Run in background thread
-        threading.Thread(target=refresh_in_background, daemon=True).start()
+        self._io_pool.submit(refresh_in_background)
     
     def update_statistics(self, logs):
         """Update the statistics display"""
+        # populate_tree only replaces the key snapshot when the logs changed,
+        # so an identical snapshot only needs the last counts put back over
+        # the loading text
+        if self._stats_snapshot is self._all_keys and self._stats_text is not None:
+            self.stats_label.config(text=self._stats_text)
+            return
+        self._stats_snapshot = self._all_keys
+        self._stats_text = None
+        
         try:
             total_logs = len(logs)
             
             # Count by type
-            type_counts = {}
-            for log in logs:
-                log_type = log['type']
-                type_counts[log_type] = type_counts.get(log_type, 0) + 1
+            type_counts = Counter(log['type'] for log in logs)
             
             # Create statistics text
             stats_text = f"Total Entries: {total_logs}"
             
             if type_counts:
-                stats_text += " | "
-                type_stats = []
-                for log_type, count in type_counts.items():
-                    type_stats.append(f"{log_type}: {count}")
-                stats_text += ", ".join(type_stats)
+                stats_text += " | " + ", ".join(
+                    f"{log_type}: {count}" for log_type, count in type_counts.items()
+                )
             
             self.stats_label.config(text=stats_text)
+            self._stats_text = stats_text
             
         except Exception as e:
             self.logger.error(f"Error updating statistics: {e}")
@@ -756,50 +1181,106 @@ class LogsWindow:
     
     def export_logs(self):
         """Export logs to a file"""
+        from tkinter import filedialog
+        
+        filters = self.get_current_filters()
+        
+        # A single-row query tells whether there is anything to export before
+        # asking for a file name
         try:
-            from tkinter import filedialog
-            import csv
-            
-            # Get current logs
-            logs = self.get_filtered_logs()
-            
-            if not logs:
-                messagebox.showinfo("No Data", "No logs to export")
-                return
-            
-            # Ask for save location
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-                title="Export Logs"
-            )
-            
-            if not filename:
-                return
-            
-            # Write CSV file
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
+            has_logs = next(self.iter_filtered_logs(*filters, limit=1), None) is not None
+        except Exception as e:
+            self.logger.error(f"Error exporting logs: {e}")
+            messagebox.showerror("Export Error", f"Failed to export logs: {e}")
+            return
+        
+        if not has_logs:
+            messagebox.showinfo("No Data", "No logs to export")
+            return
+        
+        # Ask for save location
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            title="Export Logs"
+        )
+        
+        if not filename:
+            return
+        
+        def export_in_background():
+            try:
+                import csv
+                
+                # Stream the current logs straight into the file
+                logs = self.iter_filtered_logs(*filters)
+                first = next(logs, None)
+                
+                # The logs may have been cleared since the check above
+                if first is None:
+                    self._post(lambda: messagebox.showinfo("No Data", "No logs to export"))
+                    return
                 
-                # Write header
-                writer.writerow(["Timestamp", "Type", "User", "Action", "Details"])
+                logs = itertools.chain((first,), logs)
                 
-                # Write data
-                for log in logs:
-                    timestamp_str = log['timestamp'].strftime("%Y-%m-%d %H:%M:%S")
-                    user_str = f"User {log['user_id']}" if log['user_id'] > 0 else "System"
+                # Write beside the target and swap it in once complete, so a
+                # failed export never leaves a truncated file behind
+                partial_path = filename + '.part'
+                try:
+                    # Write CSV file
+                    with open(partial_path, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as csvfile:
+                        writer = csv.writer(csvfile)
+                        
+                        # Write header
+                        writer.writerow(EXPORT_COLUMNS)
+                        
+                        # Write data; timestamp, type and user never need quoting,
+                        # so only action and details go through quote checks
+                        quote = self.quote_csv_field
+                        csvfile.writelines(
+                            f"{timestamp},{log_type},{user},{quote(action)},{quote(details)}\r\n"
+                            for timestamp, log_type, user, action, details
+                            in map(self.format_export_row, logs)
+                        )
                     
-                    writer.writerow([
-                        timestamp_str,
-                        log['type'],
-                        user_str,
-                        log['action'],
-                        log['details']
-                    ])
-            
-            messagebox.showinfo("Export Complete", f"Logs exported to {filename}")
-            self.logger.info(f"Logs exported to {filename}")
-            
-        except Exception as e:
-            self.logger.error(f"Error exporting logs: {e}")
-            messagebox.showerror("Export Error", f"Failed to export logs: {e}")
\ No newline at end of file
+                    with open(partial_path, 'r+b') as exported:
+                        os.fsync(exported.fileno())
+                    os.replace(partial_path, filename)
+                    
+                except Exception:
+                    try:
+                        os.remove(partial_path)
+                    except OSError:
+                        pass
+                    raise
+                
+                self.logger.info(f"Logs exported to {filename}")
+                self._post(lambda: messagebox.showinfo("Export Complete", f"Logs exported to {filename}"))
+                
+            except Exception as e:
+                self.logger.error(f"Error exporting logs: {e}")
+                self._post(lambda error=e: messagebox.showerror("Export Error", f"Failed to export logs: {error}"))
+        
+        # Write the file in the background so the window stays responsive
+        self._io_pool.submit(export_in_background)
+    
+    @staticmethod
+    def format_export_row(log):
+        """Build the CSV values for a log entry"""
+        return (
+            log['timestamp'].isoformat(sep=' ', timespec='seconds'),
+            log['type'],
+            format_user(log['user_id']),
+            log['action'],
+            log['details']
+        )
+    
+    @staticmethod
+    def quote_csv_field(value):
+        """Quote a field the way csv.writer's QUOTE_MINIMAL would"""
+        if value is None:
+            return ''
+        value = str(value)
+        if CSV_SPECIAL_RE.search(value):
+            return '"' + value.replace('"', '""') + '"'
+        return value
\ No newline at end of file
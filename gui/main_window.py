@@ -4,11 +4,15 @@ Modern, optimized GUI interface with enhanced styling
 """
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
+import importlib
 import logging
+import subprocess
+import sys
 from datetime import datetime
 from typing import Optional
-import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 
 from managers.camera_manager import CameraManager
 from managers.authentication_manager import AuthenticationManager
@@ -19,36 +23,166 @@ from database.database_manager import DatabaseManager
 from config import APP_NAME, APP_VERSION, POPUP_DISPLAY_TIME
 from gui.notification_system import NotificationManager
 
+# ttk styles live in the Tcl interpreter, so they only need configuring once
+_STYLES_INITIALIZED = False
+
+# Status polling backs off between these bounds (ms) while the camera state is stable
+STATUS_POLL_MIN_INTERVAL = 500
+STATUS_POLL_MAX_INTERVAL = 10_000
+
+# Status probes are slow, so results are shared for this long (seconds)
+STATUS_CACHE_TTL = 0.25
+
+# Refresh requests arriving within this window (ms) share a single probe
+STATUS_REFRESH_DEBOUNCE = 75
+
+# Bits of the packed blocking status (see pack_blocking_status)
+BLOCKED_PRIVACY_REGISTRY = 1 << 0
+BLOCKED_GROUP_POLICY = 1 << 1
+BLOCKED_LOCK_FILE = 1 << 2
+CAMERA_ACCESSIBLE = 1 << 3
+BLOCKING_METHODS_MASK = BLOCKED_PRIVACY_REGISTRY | BLOCKED_GROUP_POLICY | BLOCKED_LOCK_FILE
+
+
+def pack_blocking_status(blocking_status: dict) -> int:
+    """Pack the blocking status flags into a small int bitmask"""
+    get = blocking_status.get
+    return (
+        bool(get('privacy_registry')) * BLOCKED_PRIVACY_REGISTRY
+        | bool(get('group_policy')) * BLOCKED_GROUP_POLICY
+        | bool(get('lock_file')) * BLOCKED_LOCK_FILE
+        | bool(get('camera_accessible', True)) * CAMERA_ACCESSIBLE
+    )
+
+
+def count_blocking_methods(mask: int) -> int:
+    """Number of active blocking methods in a packed blocking status"""
+    return bin(mask & BLOCKING_METHODS_MASK).count('1')
+
+
+# Status label text/foreground and enable/disable button states per camera state
+STATUS_DISPLAY = {
+    True: ("✅ Camera ACTIVE", "green", "disabled", "normal"),
+    False: ("🚫 Camera BLOCKED", "red", "normal", "disabled"),
+}
+
+# Secondary window modules (numpy, Tk widgets) imported in the background
+# shortly after startup so the first click on them does not pay the import
+WINDOW_MODULES = ("gui.logs_window", "gui.settings_window")
+WINDOW_PRELOAD_DELAY = 1000  # ms
+
+# Text of the About dialog
+ABOUT_TEXT = f"""
+{APP_NAME}
+
+A comprehensive camera privacy management system that provides secure control over webcam access with authentication, activity logging, and intrusion detection capabilities.
+
+Features:
+• Password-protected camera enable/disable
+• System-wide camera blocking
+• Activity logging and audit trails
+• Intrusion detection with evidence capture
+• Email notifications for security events
+
+Version: {APP_VERSION}
+""".strip()
+
+# show_detailed_popup uses a plain label for messages below these sizes
+DETAIL_LABEL_MAX_CHARS = 1000
+DETAIL_LABEL_MAX_LINES = 12
+
+# Command line for the external camera access test
+CAMERA_TEST_COMMAND = [sys.executable, "test_camera_blocking.py"]
+CAMERA_TEST_TIMEOUT = 30
+CAMERA_TEST_POLL_INTERVAL = 100  # ms
+
+# Class binding tag carrying the initial setup dialog's keyboard shortcuts
+SETUP_SHORTCUTS_TAG = "CPMSetupShortcuts"
+
 
 class MainWindow:
     """Main application window for Camera Privacy Manager"""
     
     def __init__(self):
-        """Initialize the main window and all managers"""
+        """Initialize the main window; managers are created on first use"""
         self.logger = logging.getLogger(__name__)
         
-        # Initialize managers
-        self.db_manager = DatabaseManager()
-        self.auth_manager = AuthenticationManager(self.db_manager)
-        self.camera_manager = CameraManager()
-        self.log_manager = LogManager(self.db_manager)
-        self.intrusion_detector = IntrusionDetector(self.camera_manager, self.log_manager)
-        self.email_service = EmailService()
+        # Secondary windows are built on first open and reused afterwards
+        self._logs_window = None
+        self._settings_window = None
+        
+        # Shared workers for status probes, camera actions and the camera test
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="main-window")
+        
+        # Adaptive status polling state
+        self._poll_interval = STATUS_POLL_MIN_INTERVAL
+        self._poll_job = None
+        self._last_status = None
+        self._status_cache = None
+        self._last_display_state = None
+        
+        # Debounced status refresh: a refresh is scheduled or running, and
+        # another one was requested meanwhile
+        self._status_pending = False
+        self._status_dirty = False
+        
+        # Submit/cancel callbacks of the open setup dialog, used by its shortcuts
+        self._setup_actions = None
+        self._setup_shortcuts_installed = False
+        
+        # (popup, message variable, progress bar) reused by show_progress_popup
+        self._progress_cache = None
         
         # Initialize GUI
         self.root = tk.Tk()
+        self._style = ttk.Style(self.root)
+        
+        # Build the window hidden so geometry is computed once when it is shown
+        self.root.withdraw()
         self.setup_window()
         
         # Initialize notification system
         self.notification_manager = NotificationManager(self.root)
         
         self.create_widgets()
+        self.root.deiconify()
         
-        # Check initial setup
-        self.check_initial_setup()
+        # Check initial setup once the main loop has painted the window; this
+        # is the first use of the lazily created managers
+        self.root.after_idle(self.check_initial_setup)
         
         self.logger.info("Main window initialized")
     
+    @cached_property
+    def db_manager(self):
+        """Database connection manager, created on first use"""
+        return DatabaseManager()
+    
+    @cached_property
+    def auth_manager(self):
+        """Authentication manager, created on first use"""
+        return AuthenticationManager(self.db_manager)
+    
+    @cached_property
+    def camera_manager(self):
+        """Camera control manager, created on first use"""
+        return CameraManager()
+    
+    @cached_property
+    def log_manager(self):
+        """Access log manager, created on first use"""
+        return LogManager(self.db_manager)
+    
+    @cached_property
+    def intrusion_detector(self):
+        """Intrusion detector for failed logins, created on first use"""
+        return IntrusionDetector(self.camera_manager, self.log_manager)
+    
+    @cached_property
+    def email_service(self):
+        """Email alert service, created on first use"""
+        return EmailService()
+    
     def setup_window(self):
         """Configure the main window with modern styling"""
         self.root.title(f"🔒 {APP_NAME}")
@@ -74,7 +208,6 @@ class MainWindow:
     
     def center_window(self):
         """Center the window on the screen"""
-        self.root.update_idletasks()
         width = 500
         height = 600
         x = (self.root.winfo_screenwidth() // 2) - (width // 2)
@@ -83,7 +216,12 @@ class MainWindow:
     
     def setup_styles(self):
         """Configure modern ttk styles"""
-        style = ttk.Style()
+        global _STYLES_INITIALIZED
+        if _STYLES_INITIALIZED:
+            return
+        _STYLES_INITIALIZED = True
+        
+        style = self._style
         
         # Configure modern button styles
         style.configure("Action.TButton", 
@@ -120,6 +258,9 @@ class MainWindow:
                        relief="solid",
                        borderwidth=1,
                        padding=20)
+        
+        # Prominent button used by the initial setup dialog
+        style.configure("Accent.TButton", font=("Arial", 10, "bold"))
     
     def create_widgets(self):
         """Create modern, optimized GUI widgets"""
@@ -127,26 +268,9 @@ class MainWindow:
         self.root.grid_rowconfigure(0, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
         
-        # Main scrollable frame
-        canvas = tk.Canvas(self.root, bg='#f0f0f0', highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Pack canvas and scrollbar
-        canvas.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
-        
-        # Main content frame
-        main_frame = ttk.Frame(scrollable_frame, padding="30")
-        main_frame.pack(fill=tk.BOTH, expand=True)
+        # Main content frame; the sections fit within the minimum window size
+        main_frame = ttk.Frame(self.root, padding="30")
+        main_frame.grid(row=0, column=0, sticky="nsew")
         
         # Header section
         self.create_header(main_frame)
@@ -163,11 +287,14 @@ class MainWindow:
         # Footer
         self.create_footer(main_frame)
         
-        # Update status initially
-        self.update_camera_status_async()
+        # Update status once the window has been drawn
+        self.root.after_idle(self.update_camera_status_async)
         
-        # Start periodic status updates
+        # Start periodic status updates (first poll runs STATUS_POLL_MIN_INTERVAL later)
         self.start_status_monitoring()
+        
+        # Warm up the secondary window imports once startup has settled
+        self.root.after(WINDOW_PRELOAD_DELAY, lambda: self._executor.submit(self._preload_window_modules))
     
     def create_header(self, parent):
         """Create modern header section"""
@@ -330,58 +457,10 @@ class MainWindow:
             foreground="#95a5a6"
         )
         status_label.pack()
-    
-    def test_camera_access(self):
-        """Test camera access and show results"""
-        try:
-            # Show progress
-            progress = self.show_progress_popup("Testing camera access...")
-            
-            def test_in_background():
-                try:
-                    import subprocess
-                    import sys
-                    
-                    # Run the test script
-                    result = subprocess.run([
-                        sys.executable, "test_camera_blocking.py"
-                    ], capture_output=True, text=True, timeout=30)
-                    
-                    # Update UI with results
-                    def show_results():
-                        progress.destroy()
-                        if result.returncode == 0:
-                            self.show_detailed_popup("Camera Test Results", 
-                                                   "✅ Camera blocking is working correctly!\n\n" + result.stdout)
-                        else:
-                            self.show_detailed_popup("Camera Test Results", 
-                                                   "⚠️ Camera test completed with warnings:\n\n" + result.stdout)
-                    
-                    self.root.after(0, show_results)
-                    
-                except Exception as e:
-                    def show_error():
-                        progress.destroy()
-                        self.show_error("Test Error", f"Failed to run camera test: {e}")
-                    
-                    self.root.after(0, show_error)
-            
-            # Run test in background
-            import threading
-            threading.Thread(target=test_in_background, daemon=True).start()
-            
-        except Exception as e:
-            self.logger.error(f"Error testing camera: {e}")
-            self.show_error("Error", f"Failed to start camera test: {e}")
-    
-    def create_footer(self, parent):
-        """Create footer section"""
-        footer_frame = ttk.Frame(parent)
-        footer_frame.pack(fill=tk.X, pady=(20, 0))
         
         # About and help buttons
         footer_buttons = ttk.Frame(footer_frame)
-        footer_buttons.pack()
+        footer_buttons.pack(pady=(10, 0))
         
         about_btn = ttk.Button(
             footer_buttons,
@@ -492,6 +571,7 @@ class MainWindow:
             # Create initial user
             if self.auth_manager.setup_initial_password(username, password):
                 messagebox.showinfo("Success", "Initial setup completed successfully!")
+                self._setup_actions = None
                 setup_window.destroy()
                 self.log_manager.log_system_event(1, "INITIAL_SETUP_COMPLETED")
             else:
@@ -500,6 +580,7 @@ class MainWindow:
         def cancel_setup():
             result = messagebox.askyesno("Cancel Setup", "Are you sure you want to cancel the setup?\nThe application will exit.")
             if result:
+                self._setup_actions = None
                 setup_window.destroy()
                 self.root.quit()
         
@@ -520,42 +601,46 @@ class MainWindow:
         )
         submit_btn.pack(side=tk.RIGHT)
         
-        # Configure button style for prominence
-        style = ttk.Style()
-        style.configure("Accent.TButton", font=("Arial", 10, "bold"))
-        
-        # Keyboard shortcuts
-        def on_enter(event):
-            setup_complete()
-        
-        def on_escape(event):
-            cancel_setup()
-        
-        # Bind keyboard shortcuts
-        setup_window.bind('<Return>', on_enter)
-        setup_window.bind('<KP_Enter>', on_enter)  # Numpad Enter
-        setup_window.bind('<Escape>', on_escape)
-        
-        # Bind Enter key to all entry fields
-        username_entry.bind('<Return>', on_enter)
-        password_entry.bind('<Return>', on_enter)
-        confirm_entry.bind('<Return>', on_enter)
+        # Keyboard shortcuts: the class bindings are installed once and routed
+        # to this dialog's callbacks through the shared bindtag
+        if not self._setup_shortcuts_installed:
+            self._install_setup_shortcuts()
+        self._setup_actions = (setup_complete, cancel_setup)
+        for widget in (setup_window, username_entry, password_entry, confirm_entry, cancel_btn, submit_btn):
+            widget.bindtags((SETUP_SHORTCUTS_TAG,) + widget.bindtags())
         
         # Focus on username field initially
         username_entry.focus()
         username_entry.select_range(0, tk.END)  # Select default "admin" text
     
+    def _install_setup_shortcuts(self):
+        """Bind Enter/Escape for the setup dialog on its class tag"""
+        def on_enter(event):
+            if self._setup_actions:
+                self._setup_actions[0]()
+            return "break"
+        
+        def on_escape(event):
+            if self._setup_actions:
+                self._setup_actions[1]()
+            return "break"
+        
+        self.root.bind_class(SETUP_SHORTCUTS_TAG, '<Return>', on_enter)
+        self.root.bind_class(SETUP_SHORTCUTS_TAG, '<KP_Enter>', on_enter)  # Numpad Enter
+        self.root.bind_class(SETUP_SHORTCUTS_TAG, '<Escape>', on_escape)
+        self._setup_shortcuts_installed = True
+    
     def show_admin_warning(self):
         """Show warning about administrator privileges"""
-        result = messagebox.askywarning(
+        result = messagebox.askyesno(
             "Administrator Privileges Required",
             "This application requires administrator privileges to control camera access at the system level.\n\n"
             "Without admin privileges, the camera blocking feature will not work properly.\n\n"
             "Would you like to restart the application as administrator?",
-            type=messagebox.YESNO
+            icon=messagebox.WARNING
         )
         
-        if result == messagebox.YES:
+        if result:
             try:
                 self.camera_manager.request_admin_privileges()
                 self.root.quit()
@@ -585,22 +670,22 @@ class MainWindow:
     def check_status(self):
         """Handle Check Status button click"""
         try:
-            self.update_camera_status()
+            self.update_camera_status_async()
             
             # Get detailed status
-            blocking_status = self.camera_manager.get_blocking_status()
-            camera_status = self.camera_manager.get_camera_status()
+            camera_status, blocking_status = self._get_statuses()
             
             if camera_status:
-                status_msg = "Camera Status: ACTIVE\n\n"
-                status_msg += "Camera is enabled and accessible"
+                status_msg = "Camera Status: ACTIVE\n\nCamera is enabled and accessible"
             else:
-                status_msg = "Camera Status: BLOCKED\n\n"
-                status_msg += "Blocking Methods:\n"
-                status_msg += f"• Privacy Settings: {'✓' if blocking_status['privacy_registry'] else '✗'}\n"
-                status_msg += f"• Group Policy: {'✓' if blocking_status['group_policy'] else '✗'}\n"
-                status_msg += f"• Lock File: {'✓' if blocking_status['lock_file'] else '✗'}\n"
-                status_msg += f"• Camera Access: {'✗ Blocked' if not blocking_status['camera_accessible'] else '⚠ Still Accessible'}"
+                status_msg = (
+                    "Camera Status: BLOCKED\n\n"
+                    "Blocking Methods:\n"
+                    f"• Privacy Settings: {'✓' if blocking_status['privacy_registry'] else '✗'}\n"
+                    f"• Group Policy: {'✓' if blocking_status['group_policy'] else '✗'}\n"
+                    f"• Lock File: {'✓' if blocking_status['lock_file'] else '✗'}\n"
+                    f"• Camera Access: {'✗ Blocked' if not blocking_status['camera_accessible'] else '⚠ Still Accessible'}"
+                )
             
             self.show_detailed_popup("Camera Status", status_msg)
             
@@ -608,121 +693,6 @@ class MainWindow:
             self.logger.error(f"Error checking status: {e}")
             self.show_error("Error", f"Failed to check camera status: {e}")
     
-    def enable_camera(self):
-        """Handle Enable Camera button click"""
-        try:
-            # Prompt for password
-            password = self.prompt_password("Enter password to enable camera:")
-            if not password:
-                return
-            
-            # Authenticate
-            if not self.authenticate_user(password):
-                return
-            
-            # Show progress message
-            progress_toast = self.notification_manager.show_progress_toast(
-                "Enabling Camera", 
-                "Removing blocking methods..."
-            )
-            
-            # Enable camera
-            if self.camera_manager.enable_camera():
-                progress_toast.close()
-                
-                # Verify camera is accessible
-                if self.camera_manager.get_camera_status():
-                    self.notification_manager.show_toast(
-                        "Camera Successfully Enabled",
-                        "Camera is now accessible to all applications. All blocking methods have been safely removed!",
-                        "success"
-                    )
-                else:
-                    self.notification_manager.show_toast(
-                        "Camera Enable Attempted",
-                        "Some restrictions may still be in place. Try restarting applications that need camera access.",
-                        "warning"
-                    )
-                
-                self.update_camera_status()
-                
-                # Log the action
-                user = self.auth_manager.get_current_user()
-                if user:
-                    self.log_manager.log_camera_access(user.id, "CAMERA_ENABLED")
-            else:
-                progress_toast.close()
-                self.notification_manager.show_toast(
-                    "Camera Enable Failed",
-                    "Failed to enable camera. Make sure you're running as Administrator.",
-                    "error"
-                )
-                
-        except Exception as e:
-            self.logger.error(f"Error enabling camera: {e}")
-            self.show_error("Error", f"Failed to enable camera: {e}")
-    
-    def disable_camera(self):
-        """Handle Disable Camera button click"""
-        try:
-            # Prompt for password
-            password = self.prompt_password("Enter password to disable camera:")
-            if not password:
-                return
-            
-            # Authenticate
-            if not self.authenticate_user(password):
-                return
-            
-            # Show progress message
-            progress_toast = self.notification_manager.show_progress_toast(
-                "Disabling Camera", 
-                "Applying safe blocking methods..."
-            )
-            
-            # Disable camera
-            if self.camera_manager.disable_camera():
-                progress_toast.close()
-                
-                # Get blocking status
-                blocking_status = self.camera_manager.get_blocking_status()
-                blocked_methods = sum([
-                    blocking_status['privacy_registry'],
-                    blocking_status['group_policy'], 
-                    blocking_status['lock_file']
-                ])
-                
-                if blocked_methods >= 2 and not blocking_status['camera_accessible']:
-                    self.notification_manager.show_toast(
-                        "Camera Disabled Successfully",
-                        "Camera is now blocked using safe methods. No system drivers were harmed!",
-                        "success"
-                    )
-                else:
-                    self.notification_manager.show_toast(
-                        "Camera Partially Disabled",
-                        "Some blocking methods may not be active. Check status for details.",
-                        "warning"
-                    )
-                
-                self.update_camera_status()
-                
-                # Log the action
-                user = self.auth_manager.get_current_user()
-                if user:
-                    self.log_manager.log_camera_access(user.id, "CAMERA_DISABLED")
-            else:
-                progress_toast.close()
-                self.notification_manager.show_toast(
-                    "Camera Disable Failed",
-                    "Failed to disable camera. Make sure you're running as Administrator.",
-                    "error"
-                )
-                
-        except Exception as e:
-            self.logger.error(f"Error disabling camera: {e}")
-            self.show_error("Error", f"Failed to disable camera: {e}")
-    
     def prompt_password(self, prompt: str) -> Optional[str]:
         """Prompt user for password input"""
         password = simpledialog.askstring("Password Required", prompt, show='*')
@@ -749,47 +719,117 @@ class MainWindow:
             return False
     
     def update_camera_status_async(self):
+        """Request an asynchronous status refresh, coalescing bursts of requests"""
+        if self._status_pending:
+            self._status_dirty = True
+            return
+        self._status_pending = True
+        self.root.after(STATUS_REFRESH_DEBOUNCE, self._flush_status)
+    
+    def _flush_status(self):
+        """Run the scheduled status refresh"""
+        self._status_dirty = False
+        self._do_update_camera_status()
+    
+    def _on_status_refreshed(self):
+        """Finish a status refresh and run one more if requested meanwhile"""
+        self._status_pending = False
+        if self._status_dirty:
+            self._status_dirty = False
+            self.update_camera_status_async()
+    
+    def _do_update_camera_status(self):
         """Update camera status asynchronously"""
         def update_status():
             try:
-                # Show loading state
-                self.root.after(0, lambda: self.status_label.config(text="🔄 Checking status..."))
-                
                 # Get status (this might take time)
-                status = self.camera_manager.get_camera_status()
-                blocking_status = self.camera_manager.get_blocking_status()
+                status, blocking_status = self._get_statuses()
                 
                 # Update UI in main thread
                 self.root.after(0, lambda: self._update_status_display(status, blocking_status))
                 
             except Exception as e:
                 self.logger.error(f"Error updating camera status: {e}")
-                self.root.after(0, lambda: self.status_label.config(
-                    text="❌ Status Error", 
-                    foreground="red"
-                ))
+                self.root.after(0, lambda: self._set_status_text("❌ Status Error", foreground="red"))
+            finally:
+                self.root.after(0, self._on_status_refreshed)
+        
+        # Show loading state (already on the main thread)
+        self._set_status_text("🔄 Checking status...")
         
         # Run in background thread
-        threading.Thread(target=update_status, daemon=True).start()
+        self._executor.submit(update_status)
+    
+    def _get_statuses(self, force=False):
+        """Return (camera status, blocking status), reusing a result younger than the TTL"""
+        cache = self._status_cache
+        if not force and cache and time.monotonic() - cache[0] < STATUS_CACHE_TTL:
+            return cache[1], cache[2]
+        
+        status = self.camera_manager.get_camera_status()
+        blocking_status = self.camera_manager.get_blocking_status()
+        self._status_cache = (time.monotonic(), status, blocking_status)
+        return status, blocking_status
+    
+    def start_status_monitoring(self):
+        """Schedule the next background status poll"""
+        self._poll_job = self.root.after(self._poll_interval, self._poll_status)
+    
+    def reset_status_polling(self):
+        """Poll again soon, e.g. after the user changed the camera state"""
+        self._poll_interval = STATUS_POLL_MIN_INTERVAL
+        if self._poll_job:
+            self.root.after_cancel(self._poll_job)
+        self.start_status_monitoring()
+    
+    def _poll_status(self):
+        """Probe camera status in the background without the loading indicator"""
+        def poll():
+            try:
+                status, blocking_status = self._get_statuses()
+                self.root.after(0, lambda: self._handle_poll_result(status, blocking_status))
+            except Exception as e:
+                self.logger.error(f"Error polling camera status: {e}")
+                self.root.after(0, self.start_status_monitoring)
+        
+        self._executor.submit(poll)
+    
+    def _handle_poll_result(self, status, blocking_status):
+        """Refresh the display on change and adapt the polling interval"""
+        if (status, blocking_status) != self._last_status:
+            self._poll_interval = STATUS_POLL_MIN_INTERVAL
+            self._update_status_display(status, blocking_status)
+        else:
+            self._poll_interval = min(self._poll_interval * 2, STATUS_POLL_MAX_INTERVAL)
+        self.start_status_monitoring()
+    
+    def _set_status_text(self, text, **options):
+        """Show a transient status label; the next status update repaints fully"""
+        self._last_display_state = None
+        self.status_label.config(text=text, **options)
     
     def _update_status_display(self, status, blocking_status):
         """Update status display in main thread"""
+        self._last_status = (status, blocking_status)
         try:
+            status = bool(status)
+            mask = 0 if status else pack_blocking_status(blocking_status) & BLOCKING_METHODS_MASK
+            
+            # Skip the Tcl round trips when nothing visible changed
+            display_state = (status, mask)
+            if display_state == self._last_display_state:
+                return
+            self._last_display_state = display_state
+            
+            text, foreground, enable_state, disable_state = STATUS_DISPLAY[status]
+            self.status_label.config(text=text, foreground=foreground)
+            self.enable_btn.config(state=enable_state)
+            self.disable_btn.config(state=disable_state)
+            
             if status:
-                self.status_label.config(text="✅ Camera ACTIVE", foreground="green")
                 details = "Camera is enabled and accessible to applications"
-                self.enable_btn.config(state="disabled")
-                self.disable_btn.config(state="normal")
             else:
-                self.status_label.config(text="🚫 Camera BLOCKED", foreground="red")
-                blocked_methods = sum([
-                    blocking_status.get('privacy_registry', False),
-                    blocking_status.get('group_policy', False),
-                    blocking_status.get('lock_file', False)
-                ])
-                details = f"Camera is blocked using {blocked_methods} method(s)"
-                self.enable_btn.config(state="normal")
-                self.disable_btn.config(state="disabled")
+                details = f"Camera is blocked using {count_blocking_methods(mask)} method(s)"
             
             # Show/update details
             self.status_details_label.config(text=details)
@@ -799,67 +839,41 @@ class MainWindow:
             self.logger.error(f"Error updating status display: {e}")
     
     def enable_camera_async(self):
-        """Enable camera asynchronously"""
-        def enable_camera():
-            try:
-                # Get password in main thread
-                password = None
-                password_event = threading.Event()
-                
-                def get_password():
-                    nonlocal password
-                    password = self.prompt_password("Enter password to enable camera:")
-                    password_event.set()
-                
-                self.root.after(0, get_password)
-                password_event.wait()
-                
-                if not password:
-                    return
-                
-                # Authenticate in main thread
-                auth_result = None
-                auth_event = threading.Event()
-                
-                def authenticate():
-                    nonlocal auth_result
-                    auth_result = self.authenticate_user(password)
-                    auth_event.set()
-                
-                self.root.after(0, authenticate)
-                auth_event.wait()
-                
-                if not auth_result:
-                    return
-                
-                # Show progress
-                progress_popup = None
-                self.root.after(0, lambda: setattr(self, '_progress_popup', 
-                    self.show_progress_popup("🔄 Enabling camera...")))
-                
-                # Enable camera
-                result = self.camera_manager.enable_camera()
-                
-                # Update UI
-                self.root.after(0, lambda: self._handle_enable_result(result))
-                
-            except Exception as e:
-                self.logger.error(f"Error enabling camera: {e}")
-                self.root.after(0, lambda: self.show_error("Error", f"Failed to enable camera: {e}"))
-        
-        threading.Thread(target=enable_camera, daemon=True).start()
+        """Authenticate on the main thread, then enable the camera in the background"""
+        try:
+            password = self.prompt_password("Enter password to enable camera:")
+            if not password or not self.authenticate_user(password):
+                return
+            
+            self.show_progress_popup("🔄 Enabling camera...")
+            self._executor.submit(self._do_enable)
+            
+        except Exception as e:
+            self.logger.error(f"Error enabling camera: {e}")
+            self.show_error("Error", f"Failed to enable camera: {e}")
+    
+    def _do_enable(self):
+        """Enable the camera (worker thread) and post the result to the main thread"""
+        try:
+            result = self.camera_manager.enable_camera()
+            
+            # Verify here so the registry/file checks stay off the UI thread
+            status = self._get_statuses(force=True)[0] if result else None
+            self.root.after(0, lambda: self._handle_enable_result(result, status))
+        except Exception as e:
+            self.logger.error(f"Error enabling camera: {e}")
+            self.root.after(0, self.hide_progress_popup)
+            self.root.after(0, lambda error=e: self.show_error("Error", f"Failed to enable camera: {error}"))
     
-    def _handle_enable_result(self, result):
-        """Handle enable camera result in main thread"""
+    def _handle_enable_result(self, result, status):
+        """Handle enable camera result and the re-checked camera status in main thread"""
         try:
             # Close progress popup if it exists
-            if hasattr(self, '_progress_popup'):
-                self._progress_popup.destroy()
-                delattr(self, '_progress_popup')
+            self.hide_progress_popup()
             
             if result:
                 # Verify camera is accessible
-                if self.camera_manager.get_camera_status():
+                if status:
                     self.notification_manager.show_toast(
                         "Camera Successfully Enabled",
                         "Camera is now accessible to all applications. All blocking methods have been safely removed!",
@@ -873,11 +887,12 @@ class MainWindow:
                     )
                 
                 self.update_camera_status_async()
+                self.reset_status_polling()
                 
                 # Log the action
                 user = self.auth_manager.get_current_user()
                 if user:
-                    self.log_manager.log_camera_access(user.id, "CAMERA_ENABLED")
+                    self.log_manager.log_camera_access_async(user.id, "CAMERA_ENABLED")
             else:
                 self.notification_manager.show_toast(
                     "Camera Enable Failed",
@@ -887,116 +902,42 @@ class MainWindow:
         except Exception as e:
             self.logger.error(f"Error handling enable result: {e}")
     
-    def _handle_disable_result(self, result):
-        """Handle disable camera result in main thread"""
+    def disable_camera_async(self):
+        """Authenticate on the main thread, then disable the camera in the background"""
         try:
-            # Close progress popup if it exists
-            if hasattr(self, '_progress_popup'):
-                self._progress_popup.destroy()
-                delattr(self, '_progress_popup')
+            password = self.prompt_password("Enter password to disable camera:")
+            if not password or not self.authenticate_user(password):
+                return
+            
+            self.show_progress_popup("🔄 Disabling camera...")
+            self._executor.submit(self._do_disable)
             
-            if result:
-                # Get blocking status
-                blocking_status = self.camera_manager.get_blocking_status()
-                blocked_methods = sum([
-                    blocking_status.get('privacy_registry', False),
-                    blocking_status.get('group_policy', False),
-                    blocking_status.get('lock_file', False)
-                ])
-                
-                if blocked_methods >= 2 and not blocking_status.get('camera_accessible', True):
-                    self.notification_manager.show_toast(
-                        "Camera Disabled Successfully",
-                        "Camera is now blocked using safe methods. No system drivers were harmed!",
-                        "success"
-                    )
-                else:
-                    self.notification_manager.show_toast(
-                        "Camera Partially Disabled",
-                        "Some blocking methods may not be active. Check status for details.",
-                        "warning"
-                    )
-                
-                self.update_camera_status_async()
-                
-                # Log the action
-                user = self.auth_manager.get_current_user()
-                if user:
-                    self.log_manager.log_camera_access(user.id, "CAMERA_DISABLED")
-            else:
-                self.notification_manager.show_toast(
-                    "Camera Disable Failed",
-                    "Failed to disable camera. Make sure you're running as Administrator.",
-                    "error"
-                )
         except Exception as e:
-            self.logger.error(f"Error handling disable result: {e}")
+            self.logger.error(f"Error disabling camera: {e}")
+            self.show_error("Error", f"Failed to disable camera: {e}")
     
-    def disable_camera_async(self):
-        """Disable camera asynchronously"""
-        def disable_camera():
-            try:
-                # Get password in main thread
-                password = None
-                password_event = threading.Event()
-                
-                def get_password():
-                    nonlocal password
-                    password = self.prompt_password("Enter password to disable camera:")
-                    password_event.set()
-                
-                self.root.after(0, get_password)
-                password_event.wait()
-                
-                if not password:
-                    return
-                
-                # Authenticate in main thread
-                auth_result = None
-                auth_event = threading.Event()
-                
-                def authenticate():
-                    nonlocal auth_result
-                    auth_result = self.authenticate_user(password)
-                    auth_event.set()
-                
-                self.root.after(0, authenticate)
-                auth_event.wait()
-                
-                if not auth_result:
-                    return
-                
-                # Show progress
-                self.root.after(0, lambda: setattr(self, '_progress_popup', 
-                    self.show_progress_popup("🔄 Disabling camera...")))
-                
-                # Disable camera
-                result = self.camera_manager.disable_camera()
-                
-                # Update UI
-                self.root.after(0, lambda: self._handle_disable_result(result))
-                
-            except Exception as e:
-                self.logger.error(f"Error disabling camera: {e}")
-                self.root.after(0, lambda: self.show_error("Error", f"Failed to disable camera: {e}"))
-        
-        threading.Thread(target=disable_camera, daemon=True).start()
+    def _do_disable(self):
+        """Disable the camera (worker thread) and post the result to the main thread"""
+        try:
+            result = self.camera_manager.disable_camera()
+            
+            # Verify here so the registry/file checks stay off the UI thread
+            blocking_status = self._get_statuses(force=True)[1] if result else None
+            self.root.after(0, lambda: self._handle_disable_result(result, blocking_status))
+        except Exception as e:
+            self.logger.error(f"Error disabling camera: {e}")
+            self.root.after(0, self.hide_progress_popup)
+            self.root.after(0, lambda error=e: self.show_error("Error", f"Failed to disable camera: {error}"))
     
-    def _handle_disable_result(self, result):
-        """Handle disable camera result in main thread"""
+    def _handle_disable_result(self, result, blocking_status):
+        """Handle disable camera result and the re-checked blocking status in main thread"""
         try:
-            if hasattr(self, '_progress_popup') and self._progress_popup:
-                self._progress_popup.destroy()
+            self.hide_progress_popup()
             
             if result:
-                blocking_status = self.camera_manager.get_blocking_status()
-                blocked_methods = sum([
-                    blocking_status.get('privacy_registry', False),
-                    blocking_status.get('group_policy', False), 
-                    blocking_status.get('lock_file', False)
-                ])
+                mask = pack_blocking_status(blocking_status)
                 
-                if blocked_methods >= 2 and not blocking_status.get('camera_accessible', True):
+                if count_blocking_methods(mask) >= 2 and not mask & CAMERA_ACCESSIBLE:
                     self.notification_manager.show_toast(
                         "Camera Disabled Successfully",
                         "Camera is now blocked using safe methods. No system drivers were harmed!",
@@ -1009,10 +950,12 @@ class MainWindow:
                         "warning"
                     )
                 
+                self.reset_status_polling()
+                
                 # Log the action
                 user = self.auth_manager.get_current_user()
                 if user:
-                    self.log_manager.log_camera_access(user.id, "CAMERA_DISABLED")
+                    self.log_manager.log_camera_access_async(user.id, "CAMERA_DISABLED")
             else:
                 self.show_error("Error", "Failed to disable camera.\nMake sure you're running as Administrator.")
             
@@ -1023,75 +966,100 @@ class MainWindow:
             self.logger.error(f"Error handling disable result: {e}")
     
     def test_camera_access(self):
-        """Test camera access using external script"""
+        """Test camera access using external script, streaming its output"""
         try:
-            import subprocess
-            import sys
+            title = "🧪 Camera Test Results"
+            text_widget = self.show_detailed_popup(f"🔄 {title}", "", scrollable=True)
             
-            def run_test():
-                try:
-                    result = subprocess.run([sys.executable, "test_camera_blocking.py"], 
-                                          capture_output=True, text=True, timeout=30)
-                    
-                    self.root.after(0, lambda: self._show_test_results(result.stdout, result.returncode == 0))
-                    
-                except Exception as e:
-                    self.root.after(0, lambda: self.show_error("Test Error", f"Failed to run camera test: {e}"))
+            proc = subprocess.Popen(CAMERA_TEST_COMMAND, stdout=subprocess.PIPE,
+                                    stderr=subprocess.STDOUT, text=True, bufsize=1)
+            deadline = time.monotonic() + CAMERA_TEST_TIMEOUT
             
-            # Show progress
-            progress_popup = self.show_progress_popup("🧪 Testing camera access...")
+            # Pipes cannot be read without blocking portably, so a worker
+            # forwards output lines; exit and timeout are polled here
+            def pump_output():
+                with proc.stdout:
+                    for line in proc.stdout:
+                        self.root.after(0, self._append_popup_text, text_widget, line)
             
-            def close_progress():
-                time.sleep(0.5)  # Small delay for better UX
-                self.root.after(0, progress_popup.destroy)
+            def poll():
+                returncode = proc.poll()
+                if returncode is None:
+                    if time.monotonic() > deadline:
+                        proc.kill()
+                    self.root.after(CAMERA_TEST_POLL_INTERVAL, poll)
+                    return
+                icon = "✅" if returncode == 0 else "⚠️"
+                self._set_popup_title(text_widget, f"{icon} {title}")
             
-            threading.Thread(target=close_progress, daemon=True).start()
-            threading.Thread(target=run_test, daemon=True).start()
+            self._executor.submit(pump_output)
+            self.root.after(CAMERA_TEST_POLL_INTERVAL, poll)
             
         except Exception as e:
             self.logger.error(f"Error testing camera: {e}")
             self.show_error("Error", f"Failed to test camera: {e}")
     
-    def _show_test_results(self, output, success):
-        """Show camera test results"""
-        title = "🧪 Camera Test Results"
-        if success:
-            icon = "✅"
-            msg_type = "success"
-        else:
-            icon = "⚠️"
-            msg_type = "warning"
-        
-        self.show_detailed_popup(f"{icon} {title}", output)
+    def _append_popup_text(self, text_widget, text):
+        """Append text to a read-only popup text widget if it is still open"""
+        if not text_widget.winfo_exists():
+            return
+        text_widget.config(state=tk.NORMAL)
+        text_widget.insert(tk.END, text)
+        text_widget.see(tk.END)
+        text_widget.config(state=tk.DISABLED)
+    
+    def _set_popup_title(self, text_widget, title):
+        """Retitle the popup holding text_widget if it is still open"""
+        if text_widget.winfo_exists():
+            text_widget.winfo_toplevel().title(title)
+    
+    def _preload_window_modules(self):
+        """Import the secondary window modules ahead of first use (worker thread)"""
+        for name in WINDOW_MODULES:
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                self.logger.warning(f"Failed to preload {name}: {e}")
     
     def show_logs_window(self):
         """Show the logs viewing window"""
+        if self._logs_window and self._logs_window.window.winfo_exists():
+            self._logs_window.show()
+            return
+        
         from gui.logs_window import LogsWindow
-        logs_window = LogsWindow(self.root, self.log_manager)
+        self._logs_window = LogsWindow(self.root, self.log_manager)
     
     def show_settings(self):
         """Show settings window"""
+        if self._settings_window and self._settings_window.window.winfo_exists():
+            self._settings_window.show()
+            return
+        
         from gui.settings_window import SettingsWindow
-        settings_window = SettingsWindow(self.root, self.email_service, self.auth_manager)
+        self._settings_window = SettingsWindow(self.root, self.email_service, self.auth_manager)
     
     def show_about(self):
         """Show about dialog"""
-        about_text = f"""
-{APP_NAME}
-
-A comprehensive camera privacy management system that provides secure control over webcam access with authentication, activity logging, and intrusion detection capabilities.
+        messagebox.showinfo("About", ABOUT_TEXT)
+    
+    def show_help(self):
+        """Show help dialog"""
+        help_text = """
+Camera Controls:
+• Enable Camera / Disable Camera - change camera access (password required)
+• Detailed Status - show which blocking methods are active
+• Refresh - re-check the current camera status
 
-Features:
-• Password-protected camera enable/disable
-• System-wide camera blocking
-• Activity logging and audit trails
-• Intrusion detection with evidence capture
-• Email notifications for security events
+Quick Actions:
+• View Logs - browse access logs and intrusion evidence
+• Settings - configure email alerts, security and system options
+• Test Camera - run the camera access test and show its output
 
-Version: 1.0.0
+Most blocking methods need the application to run as Administrator.
         """.strip()
         
-        messagebox.showinfo("About", about_text)
+        self.show_detailed_popup("❓ Help", help_text)
     
     def show_popup(self, message: str):
         """Show temporary popup message"""
@@ -1114,34 +1082,59 @@ Version: 1.0.0
         # Auto-close after delay
         popup.after(POPUP_DISPLAY_TIME, popup.destroy)
     
-    def show_progress_popup(self, message: str):
-        """Show progress popup that can be manually closed"""
+    def _build_progress_popup(self):
+        """Create the hidden progress popup reused by show_progress_popup"""
         popup = tk.Toplevel(self.root)
+        popup.withdraw()
         popup.title("Please Wait")
-        popup.geometry("300x100")
         popup.transient(self.root)
-        popup.grab_set()
-        
-        # Center the popup
-        popup.update_idletasks()
-        x = (popup.winfo_screenwidth() // 2) - 150
-        y = (popup.winfo_screenheight() // 2) - 50
-        popup.geometry(f"300x100+{x}+{y}")
+        popup.protocol("WM_DELETE_WINDOW", self.hide_progress_popup)
         
         # Message label
-        label = ttk.Label(popup, text=message, font=("Arial", 10))
+        message_var = tk.StringVar(popup)
+        label = ttk.Label(popup, textvariable=message_var, font=("Arial", 10))
         label.pack(expand=True)
         
         # Progress bar
         progress = ttk.Progressbar(popup, mode='indeterminate')
         progress.pack(pady=10, padx=20, fill=tk.X)
+        
+        self._progress_cache = (popup, message_var, progress)
+    
+    def show_progress_popup(self, message: str):
+        """Show progress popup that can be manually closed"""
+        if self._progress_cache is None or not self._progress_cache[0].winfo_exists():
+            self._build_progress_popup()
+        popup, message_var, progress = self._progress_cache
+        message_var.set(message)
+        
+        # Center the popup
+        x = (popup.winfo_screenwidth() // 2) - 150
+        y = (popup.winfo_screenheight() // 2) - 50
+        popup.geometry(f"300x100+{x}+{y}")
+        
+        popup.deiconify()
+        popup.grab_set()
         progress.start()
         
         popup.update()
         return popup
     
-    def show_detailed_popup(self, title: str, message: str):
-        """Show detailed popup with more information"""
+    def hide_progress_popup(self):
+        """Hide the progress popup, keeping it for the next action"""
+        if self._progress_cache is None or not self._progress_cache[0].winfo_exists():
+            return
+        popup, _, progress = self._progress_cache
+        progress.stop()
+        popup.grab_release()
+        popup.withdraw()
+    
+    def show_detailed_popup(self, title: str, message: str, scrollable: bool = False) -> Optional[tk.Text]:
+        """
+        Show detailed popup with more information
+        Short messages use a plain label; long ones (or scrollable=True, e.g. for
+        streamed output) use a scrollable text widget, which is returned
+        """
         popup = tk.Toplevel(self.root)
         popup.title(title)
         popup.geometry("400x300")
@@ -1158,8 +1151,24 @@ Version: 1.0.0
         main_frame = ttk.Frame(popup, padding="20")
         main_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Message label with scrollbar
-        text_frame = ttk.Frame(main_frame)
+        # Short messages fit in a label without the cost of a Text widget
+        text_widget = None
+        if not scrollable and len(message) < DETAIL_LABEL_MAX_CHARS and message.count('\n') < DETAIL_LABEL_MAX_LINES:
+            message_label = ttk.Label(main_frame, text=message, justify=tk.LEFT, font=("Arial", 10), wraplength=340)
+            message_label.pack(fill=tk.BOTH, expand=True, anchor=tk.NW)
+        else:
+            text_widget = self._create_detail_text(main_frame, message)
+        
+        # Close button
+        close_btn = ttk.Button(main_frame, text="Close", command=popup.destroy)
+        close_btn.pack(pady=(10, 0))
+        
+        return text_widget
+    
+    def _create_detail_text(self, parent, message: str) -> tk.Text:
+        """Create the read-only scrollable text view used by show_detailed_popup"""
+        # Message text with scrollbar
+        text_frame = ttk.Frame(parent)
         text_frame.pack(fill=tk.BOTH, expand=True)
         
         text_widget = tk.Text(text_frame, wrap=tk.WORD, font=("Arial", 10), height=12, width=45)
@@ -1172,9 +1181,7 @@ Version: 1.0.0
         text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Close button
-        close_btn = ttk.Button(main_frame, text="Close", command=popup.destroy)
-        close_btn.pack(pady=(10, 0))
+        return text_widget
     
     def show_error(self, title: str, message: str):
         """Show error message dialog"""
@@ -1194,28 +1201,22 @@ Version: 1.0.0
     def cleanup(self):
         """Cleanup resources before exit"""
         try:
+            # Stop background workers
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            if self._logs_window:
+                self._logs_window.destroy()
+            
             # Clear notifications
-            if hasattr(self, 'notification_manager'):
-                self.notification_manager.clear_all_notifications()
+            self.notification_manager.clear_all_notifications()
             
-            # Logout user
-            if hasattr(self, 'auth_manager'):
+            # Logout user (managers that were never created need no cleanup)
+            if 'auth_manager' in self.__dict__:
                 self.auth_manager.logout_user()
             
             # Close database
-            if hasattr(self, 'db_manager'):
+            if 'db_manager' in self.__dict__:
                 self.db_manager.close()
             
             self.logger.info("Application cleanup completed")
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
-    
-    def __getattr__(self, name):
-        """Fallback for missing attributes to prevent AttributeError"""
-        if name.startswith('_'):
-            # For private attributes, return None
-            return None
-        else:
-            # For public attributes, log warning and return a dummy function
-            self.logger.warning(f"Accessing undefined attribute: {name}")
-            return lambda *args, **kwargs: None
\ No newline at end of file
+            self.logger.error(f"Error during cleanup: {e}")
\ No newline at end of file
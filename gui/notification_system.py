@@ -7,6 +7,13 @@ from tkinter import ttk
 import threading
 import time
 
+# Identical toasts shown within this many seconds of each other are dropped
+DUPLICATE_TOAST_WINDOW = 1.0
+# Once the recent-toast record holds this many entries, those older than
+# RECENT_TOAST_RETENTION seconds are pruned
+RECENT_TOAST_PRUNE_SIZE = 16
+RECENT_TOAST_RETENTION = 5.0
+
 
 class NotificationManager:
     """Manages modern notifications and popups"""
@@ -14,149 +21,221 @@ class NotificationManager:
     def __init__(self, parent_window):
         """Initialize notification manager"""
         self.parent = parent_window
-        self.active_notifications = []
+        self.active_notifications = set()
+        ToastNotification.configure_styles(parent_window)
+        
+        # Screen size used to place toasts, queried once
+        self.screen_width = parent_window.winfo_screenwidth()
+        self.screen_height = parent_window.winfo_screenheight()
+        
+        # One reusable toast window per notification type
+        self.toasts = {}
+        
+        # (type, title, message) -> monotonic time the toast was last shown
+        self._recent = {}
     
     def show_toast(self, title: str, message: str, notification_type: str = "info", duration: int = 4000):
         """Show modern toast notification"""
-        toast = ToastNotification(self.parent, title, message, notification_type, duration)
-        self.active_notifications.append(toast)
-        toast.show()
+        # Suppress repeats of the same toast, e.g. from a double click
+        now = time.monotonic()
+        key = (notification_type, title, message)
+        if now - self._recent.get(key, float("-inf")) < DUPLICATE_TOAST_WINDOW:
+            return
+        if len(self._recent) > RECENT_TOAST_PRUNE_SIZE:
+            self._recent = {k: t for k, t in self._recent.items() if now - t < RECENT_TOAST_RETENTION}
+        self._recent[key] = now
         
-        # Auto-remove from list when closed
-        def remove_notification():
-            if toast in self.active_notifications:
-                self.active_notifications.remove(toast)
-        
-        self.parent.after(duration + 500, remove_notification)
+        toast = self.toasts.get(notification_type)
+        if toast is None:
+            toast = ToastNotification(self.parent, title, message, notification_type, duration, manager=self)
+            self.toasts[notification_type] = toast
+        else:
+            toast.title = title
+            toast.message = message
+            toast.duration = duration
+        toast.show()
+    
+    def visible_toasts(self):
+        """Toasts currently on screen"""
+        return [toast for toast in self.toasts.values() if toast.visible]
     
     def show_progress_toast(self, title: str, message: str):
         """Show progress toast that can be updated"""
-        toast = ProgressToast(self.parent, title, message)
-        self.active_notifications.append(toast)
+        toast = ProgressToast(self.parent, title, message, manager=self)
+        self.active_notifications.add(toast)
         toast.show()
         return toast
     
     def clear_all_notifications(self):
         """Clear all active notifications"""
-        for notification in self.active_notifications:
+        # Reusable toasts have fade/auto-close callbacks that must not outlive them
+        for toast in self.toasts.values():
+            if toast.window:
+                toast.cancel_pending()
+        
+        notifications = [*self.active_notifications, *self.toasts.values()]
+        windows = [n.window for n in notifications if n.window]
+        self.active_notifications.clear()
+        self.toasts.clear()
+        self._recent.clear()
+        
+        for window in windows:
             try:
-                notification.close()
-            except:
+                window.destroy()
+            except tk.TclError:
                 pass
-        self.active_notifications.clear()
 
 
 class ToastNotification:
-    """Modern toast notification"""
+    """Modern toast notification, built once and re-shown with new text"""
+    
+    # Type configurations
+    TYPE_CONFIG = {
+        "info": {"bg": "#3498db", "fg": "white", "icon": "ℹ️"},
+        "success": {"bg": "#27ae60", "fg": "white", "icon": "✅"},
+        "warning": {"bg": "#f39c12", "fg": "white", "icon": "⚠️"},
+        "error": {"bg": "#e74c3c", "fg": "white", "icon": "❌"}
+    }
     
-    def __init__(self, parent, title, message, notification_type="info", duration=4000):
+    # Fade animation: alpha moves in FADE_STEPS steps, FADE_INTERVAL ms apart
+    FADE_STEPS = 10
+    FADE_INTERVAL = 30
+    
+    # ttk styles live in the Tcl interpreter, so they only need configuring once
+    _styles_configured = False
+    
+    @classmethod
+    def configure_styles(cls, master):
+        """Define the per-type toast and progress toast styles"""
+        if cls._styles_configured:
+            return
+        cls._styles_configured = True
+        
+        style = ttk.Style(master)
+        for kind, config in cls.TYPE_CONFIG.items():
+            colors = {"background": config["bg"], "foreground": config["fg"]}
+            style.configure(f"Toast.{kind}.TFrame", background=config["bg"], relief="solid", borderwidth=1)
+            style.configure(f"ToastHeader.{kind}.TFrame", background=config["bg"])
+            style.configure(f"Toast.{kind}.TLabel", font=("Segoe UI", 9), **colors)
+            style.configure(f"ToastIcon.{kind}.TLabel", font=("Segoe UI", 12), **colors)
+            style.configure(f"ToastTitle.{kind}.TLabel", font=("Segoe UI", 10, "bold"), **colors)
+            style.configure(f"ToastClose.{kind}.TLabel", font=("Segoe UI", 10), **colors)
+        
+        # Progress toasts
+        progress_colors = {"background": ProgressToast.BACKGROUND, "foreground": "white"}
+        style.configure("ProgressToast.TFrame", background=ProgressToast.BACKGROUND, relief="solid", borderwidth=1)
+        style.configure("ProgressToast.TLabel", font=("Segoe UI", 9), **progress_colors)
+        style.configure("ProgressToastTitle.TLabel", font=("Segoe UI", 10, "bold"), **progress_colors)
+    
+    def __init__(self, parent, title, message, notification_type="info", duration=4000, manager=None):
         """Initialize toast notification"""
         self.parent = parent
+        self.manager = manager
         self.title = title
         self.message = message
         self.type = notification_type
         self.duration = duration
         self.window = None
+        self.title_label = None
+        self.message_label = None
+        self.visible = False
         
-        # Type configurations
-        self.type_config = {
-            "info": {"bg": "#3498db", "fg": "white", "icon": "ℹ️"},
-            "success": {"bg": "#27ae60", "fg": "white", "icon": "✅"},
-            "warning": {"bg": "#f39c12", "fg": "white", "icon": "⚠️"},
-            "error": {"bg": "#e74c3c", "fg": "white", "icon": "❌"}
-        }
+        # Pending fade step and auto-close callbacks
+        self._animation_job = None
+        self._close_job = None
     
     def show(self):
         """Show the toast notification"""
         try:
-            # Create toast window
-            self.window = tk.Toplevel(self.parent)
-            self.window.withdraw()  # Hide initially
-            
-            # Configure window
-            self.window.overrideredirect(True)  # Remove window decorations
-            self.window.attributes('-topmost', True)  # Always on top
-            
-            # Get configuration
-            config = self.type_config.get(self.type, self.type_config["info"])
-            
-            # Create main frame
-            main_frame = tk.Frame(
-                self.window,
-                bg=config["bg"],
-                relief="solid",
-                bd=1
-            )
-            main_frame.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
-            
-            # Icon and title frame
-            header_frame = tk.Frame(main_frame, bg=config["bg"])
-            header_frame.pack(fill=tk.X, padx=15, pady=(10, 5))
-            
-            # Icon
-            icon_label = tk.Label(
-                header_frame,
-                text=config["icon"],
-                bg=config["bg"],
-                fg=config["fg"],
-                font=("Segoe UI", 12)
-            )
-            icon_label.pack(side=tk.LEFT)
-            
-            # Title
-            title_label = tk.Label(
-                header_frame,
-                text=self.title,
-                bg=config["bg"],
-                fg=config["fg"],
-                font=("Segoe UI", 10, "bold")
-            )
-            title_label.pack(side=tk.LEFT, padx=(10, 0))
-            
-            # Close button
-            close_btn = tk.Label(
-                header_frame,
-                text="✕",
-                bg=config["bg"],
-                fg=config["fg"],
-                font=("Segoe UI", 10),
-                cursor="hand2"
-            )
-            close_btn.pack(side=tk.RIGHT)
-            close_btn.bind("<Button-1>", lambda e: self.close())
-            
-            # Message
-            message_label = tk.Label(
-                main_frame,
-                text=self.message,
-                bg=config["bg"],
-                fg=config["fg"],
-                font=("Segoe UI", 9),
-                wraplength=300,
-                justify=tk.LEFT
-            )
-            message_label.pack(fill=tk.X, padx=15, pady=(0, 10))
+            if self.window is None:
+                self.build()
+            else:
+                self.cancel_pending()
+                self.title_label.configure(text=self.title)
+                self.message_label.configure(text=self.message)
             
             # Position toast
-            self.position_toast()
-            
-            # Show with animation
+            others = self.other_visible_toasts()
+            self.position_toast(len(others))
+            self.visible = True
+            
+            # Show with animation, or snap in during a burst of toasts
+            if others:
+                self.window.deiconify()
+                self.window.attributes('-alpha', 1.0)
+                self._close_job = self.window.after(self.duration, self.close)
+                return
             self.animate_in()
             
             # Auto-close after duration
-            self.window.after(self.duration, self.animate_out)
+            self._close_job = self.window.after(self.duration, self.animate_out)
             
         except Exception as e:
             print(f"Error showing toast: {e}")
     
-    def position_toast(self):
-        """Position toast in bottom-right corner"""
+    def build(self):
+        """Create the toast window and its widgets"""
+        # Create toast window
+        self.window = tk.Toplevel(self.parent)
+        self.window.withdraw()  # Hide initially
+        
+        # Configure window
+        self.window.overrideredirect(True)  # Remove window decorations
+        self.window.attributes('-topmost', True)  # Always on top
+        
+        # Get configuration
+        kind = self.type if self.type in self.TYPE_CONFIG else "info"
+        config = self.TYPE_CONFIG[kind]
+        self.configure_styles(self.parent)
+        
+        # Create main frame
+        main_frame = ttk.Frame(self.window, style=f"Toast.{kind}.TFrame")
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
+        
+        # Icon and title frame
+        header_frame = ttk.Frame(main_frame, style=f"ToastHeader.{kind}.TFrame")
+        header_frame.pack(fill=tk.X, padx=15, pady=(10, 5))
+        
+        # Icon
+        icon_label = ttk.Label(header_frame, text=config["icon"], style=f"ToastIcon.{kind}.TLabel")
+        icon_label.pack(side=tk.LEFT)
+        
+        # Title
+        self.title_label = ttk.Label(header_frame, text=self.title, style=f"ToastTitle.{kind}.TLabel")
+        self.title_label.pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Close button
+        close_btn = ttk.Label(header_frame, text="✕", style=f"ToastClose.{kind}.TLabel", cursor="hand2")
+        close_btn.pack(side=tk.RIGHT)
+        close_btn.bind("<Button-1>", lambda e: self.close())
+        
+        # Message
+        self.message_label = ttk.Label(
+            main_frame,
+            text=self.message,
+            style=f"Toast.{kind}.TLabel",
+            wraplength=300,
+            justify=tk.LEFT
+        )
+        self.message_label.pack(fill=tk.X, padx=15, pady=(0, 10))
+    
+    def other_visible_toasts(self):
+        """Other toasts of the same manager that are currently on screen"""
+        if self.manager is None:
+            return []
+        return [toast for toast in self.manager.visible_toasts() if toast is not self]
+    
+    def position_toast(self, stack_index: int = 0):
+        """Position toast in bottom-right corner, above stack_index visible toasts"""
         try:
             self.window.update_idletasks()
             
             # Get screen dimensions
-            screen_width = self.window.winfo_screenwidth()
-            screen_height = self.window.winfo_screenheight()
+            if self.manager is not None:
+                screen_width, screen_height = self.manager.screen_width, self.manager.screen_height
+            else:
+                screen_width = self.window.winfo_screenwidth()
+                screen_height = self.window.winfo_screenheight()
             
             # Get toast dimensions
             toast_width = 350
@@ -167,8 +246,7 @@ class ToastNotification:
             y = screen_height - toast_height - 50
             
             # Adjust for multiple toasts
-            offset = len([n for n in getattr(self.parent, 'notification_manager', {}).get('active_notifications', [])]) * (toast_height + 10)
-            y -= offset
+            y -= stack_index * (toast_height + 10)
             
             self.window.geometry(f"{toast_width}x{toast_height}+{x}+{y}")
             
@@ -179,16 +257,7 @@ class ToastNotification:
         """Animate toast sliding in"""
         try:
             self.window.deiconify()  # Show window
-            self.window.attributes('-alpha', 0.0)  # Start transparent
-            
-            # Fade in animation
-            def fade_in(alpha=0.0):
-                if alpha < 1.0:
-                    alpha += 0.1
-                    self.window.attributes('-alpha', alpha)
-                    self.window.after(30, lambda: fade_in(alpha))
-            
-            fade_in()
+            self.fade(0, 1)  # Fade in from transparent
             
         except Exception as e:
             print(f"Error animating toast in: {e}")
@@ -196,37 +265,62 @@ class ToastNotification:
     def animate_out(self):
         """Animate toast sliding out"""
         try:
-            # Fade out animation
-            def fade_out(alpha=1.0):
-                if alpha > 0.0:
-                    alpha -= 0.1
-                    self.window.attributes('-alpha', alpha)
-                    self.window.after(30, lambda: fade_out(alpha))
-                else:
-                    self.close()
-            
-            fade_out()
+            self.fade(self.FADE_STEPS, -1)
             
         except Exception as e:
             print(f"Error animating toast out: {e}")
             self.close()
     
+    def fade(self, step: int, direction: int):
+        """Set alpha to step/FADE_STEPS and schedule the next step; close once faded out"""
+        self.window.attributes('-alpha', step / self.FADE_STEPS)
+        step += direction
+        if 0 <= step <= self.FADE_STEPS:
+            self._animation_job = self.window.after(self.FADE_INTERVAL, self.fade, step, direction)
+        else:
+            self._animation_job = None
+            if direction < 0:
+                self.close()
+    
+    def cancel_pending(self):
+        """Cancel any running fade and the scheduled auto-close"""
+        for job in (self._animation_job, self._close_job):
+            if job:
+                self.window.after_cancel(job)
+        self._animation_job = None
+        self._close_job = None
+    
     def close(self):
-        """Close the toast notification"""
+        """Hide the toast notification so it can be shown again"""
+        try:
+            if self.window:
+                self.cancel_pending()
+                self.window.withdraw()
+                self.visible = False
+        except Exception as e:
+            print(f"Error closing toast: {e}")
+    
+    def destroy(self):
+        """Destroy the toast window"""
         try:
             if self.window:
+                self.cancel_pending()
                 self.window.destroy()
                 self.window = None
+                self.visible = False
         except Exception as e:
-            print(f"Error closing toast: {e}")
+            print(f"Error destroying toast: {e}")
 
 
 class ProgressToast:
     """Progress toast notification"""
     
-    def __init__(self, parent, title, message):
+    BACKGROUND = "#34495e"
+    
+    def __init__(self, parent, title, message, manager=None):
         """Initialize progress toast"""
         self.parent = parent
+        self.manager = manager
         self.title = title
         self.message = message
         self.window = None
@@ -242,34 +336,20 @@ class ProgressToast:
             self.window.overrideredirect(True)
             self.window.attributes('-topmost', True)
             
+            # Styles are shared with the other toasts
+            ToastNotification.configure_styles(self.parent)
+            
             # Main frame
-            main_frame = tk.Frame(
-                self.window,
-                bg="#34495e",
-                relief="solid",
-                bd=1
-            )
+            main_frame = ttk.Frame(self.window, style="ProgressToast.TFrame")
             main_frame.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
             
             # Title
-            title_label = tk.Label(
-                main_frame,
-                text=self.title,
-                bg="#34495e",
-                fg="white",
-                font=("Segoe UI", 10, "bold")
-            )
+            title_label = ttk.Label(main_frame, text=self.title, style="ProgressToastTitle.TLabel")
             title_label.pack(pady=(10, 5))
             
             # Status
             self.status_var = tk.StringVar(value=self.message)
-            status_label = tk.Label(
-                main_frame,
-                textvariable=self.status_var,
-                bg="#34495e",
-                fg="white",
-                font=("Segoe UI", 9)
-            )
+            status_label = ttk.Label(main_frame, textvariable=self.status_var, style="ProgressToast.TLabel")
             status_label.pack(pady=(0, 10))
             
             # Progress bar
@@ -294,8 +374,11 @@ class ProgressToast:
         try:
             self.window.update_idletasks()
             
-            screen_width = self.window.winfo_screenwidth()
-            screen_height = self.window.winfo_screenheight()
+            if self.manager is not None:
+                screen_width, screen_height = self.manager.screen_width, self.manager.screen_height
+            else:
+                screen_width = self.window.winfo_screenwidth()
+                screen_height = self.window.winfo_screenheight()
             
             toast_width = 300
             toast_height = self.window.winfo_reqheight()
@@ -319,6 +402,8 @@ class ProgressToast:
     def close(self):
         """Close progress toast"""
         try:
+            if self.manager is not None:
+                self.manager.active_notifications.discard(self)
             if self.window:
                 self.window.destroy()
                 self.window = None
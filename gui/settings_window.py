@@ -13,6 +13,28 @@ from managers.authentication_manager import AuthenticationManager
 class SettingsWindow:
     """Window for application settings"""
     
+    # Email settings entries: (label, variable attribute, default, masked)
+    EMAIL_FIELDS = (
+        ("SMTP Server:", "smtp_server_var", "", False),
+        ("SMTP Port:", "smtp_port_var", "587", False),
+        ("Username:", "email_username_var", "", False),
+        ("Password:", "email_password_var", "", True),
+        ("From Email:", "from_email_var", "", False),
+    )
+    
+    # Notebook tabs: (section name, tab label); each is built on first selection
+    SECTIONS = (
+        ("email", "Email"),
+        ("security", "Security"),
+        ("system", "System"),
+    )
+    
+    # Defaults of the security and system entries, which are not stored yet
+    SECTION_DEFAULTS = {
+        "security": {"max_attempts_var": "3", "time_window_var": "15"},
+        "system": {"cleanup_days_var": "30"},
+    }
+    
     def __init__(self, parent, email_service: EmailService, auth_manager: AuthenticationManager):
         """Initialize settings window"""
         self.parent = parent
@@ -25,18 +47,33 @@ class SettingsWindow:
         self.window.title("Settings")
         self.window.geometry("500x600")
         self.window.transient(parent)
+        # Closing only hides the window so it can be shown again without rebuilding
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)
+        
+        # Build hidden so Tk lays the window out once when it is shown
+        self.window.withdraw()
         
         # Center the window
         self.center_window()
         
-        # Create widgets
+        # Create widgets (the selected tab loads its settings as it is built)
         self.create_widgets()
         
-        # Load current settings
-        self.load_settings()
+        self.window.deiconify()
         
         self.logger.info("Settings window opened")
     
+    def show(self):
+        """Show the window again with the current settings"""
+        self.load_settings()
+        self.window.deiconify()
+        self.window.lift()
+        self.window.focus_force()
+    
+    def hide(self):
+        """Hide the window, keeping its widgets for the next open"""
+        self.window.withdraw()
+    
     def center_window(self):
         """Center the window on the screen"""
         self.window.update_idletasks()
@@ -46,39 +83,27 @@ class SettingsWindow:
     
     def create_widgets(self):
         """Create and arrange GUI widgets"""
-        # Main frame with scrollbar
-        canvas = tk.Canvas(self.window)
-        scrollbar = ttk.Scrollbar(self.window, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Pack canvas and scrollbar
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
         # Main content frame
-        main_frame = ttk.Frame(scrollable_frame, padding="20")
+        main_frame = ttk.Frame(self.window, padding="20")
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Title
         title_label = ttk.Label(main_frame, text="Settings", font=("Arial", 16, "bold"))
         title_label.pack(pady=(0, 20))
         
-        # Email Settings Section
-        self.create_email_settings(main_frame)
+        # One empty tab per section, filled in when first selected
+        self.notebook = ttk.Notebook(main_frame)
+        self.notebook.pack(fill=tk.BOTH, expand=True)
         
-        # Security Settings Section
-        self.create_security_settings(main_frame)
+        self._tabs = {}
+        self._built_sections = set()
+        for name, text in self.SECTIONS:
+            tab = ttk.Frame(self.notebook, padding="10")
+            self.notebook.add(tab, text=text)
+            self._tabs[name] = tab
         
-        # System Settings Section
-        self.create_system_settings(main_frame)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._on_tab_changed()
         
         # Buttons frame
         buttons_frame = ttk.Frame(main_frame)
@@ -93,43 +118,37 @@ class SettingsWindow:
         test_email_btn.pack(side=tk.LEFT, padx=(0, 10))
         
         # Cancel button
-        cancel_btn = ttk.Button(buttons_frame, text="Cancel", command=self.window.destroy)
+        cancel_btn = ttk.Button(buttons_frame, text="Cancel", command=self.hide)
         cancel_btn.pack(side=tk.RIGHT)
     
+    def _on_tab_changed(self, event=None):
+        """Build the selected section the first time its tab is shown"""
+        name = self.SECTIONS[self.notebook.index("current")][0]
+        self._build_section(name)
+    
+    def _build_section(self, name):
+        """Create a section's widgets once and load its settings"""
+        if name in self._built_sections:
+            return
+        
+        getattr(self, f"create_{name}_settings")(self._tabs[name])
+        self._built_sections.add(name)
+        
+        if name == "email":
+            self.load_settings()
+    
     def create_email_settings(self, parent):
         """Create email settings section"""
         email_frame = ttk.LabelFrame(parent, text="Email Notification Settings", padding="10")
         email_frame.pack(fill=tk.X, pady=(0, 20))
         
-        # SMTP Server
-        ttk.Label(email_frame, text="SMTP Server:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.smtp_server_var = tk.StringVar()
-        smtp_server_entry = ttk.Entry(email_frame, textvariable=self.smtp_server_var, width=30)
-        smtp_server_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), pady=2, padx=(10, 0))
-        
-        # SMTP Port
-        ttk.Label(email_frame, text="SMTP Port:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.smtp_port_var = tk.StringVar(value="587")
-        smtp_port_entry = ttk.Entry(email_frame, textvariable=self.smtp_port_var, width=30)
-        smtp_port_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=2, padx=(10, 0))
-        
-        # Username
-        ttk.Label(email_frame, text="Username:").grid(row=2, column=0, sticky=tk.W, pady=2)
-        self.email_username_var = tk.StringVar()
-        email_username_entry = ttk.Entry(email_frame, textvariable=self.email_username_var, width=30)
-        email_username_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=2, padx=(10, 0))
-        
-        # Password
-        ttk.Label(email_frame, text="Password:").grid(row=3, column=0, sticky=tk.W, pady=2)
-        self.email_password_var = tk.StringVar()
-        email_password_entry = ttk.Entry(email_frame, textvariable=self.email_password_var, width=30, show="*")
-        email_password_entry.grid(row=3, column=1, sticky=(tk.W, tk.E), pady=2, padx=(10, 0))
-        
-        # From Email
-        ttk.Label(email_frame, text="From Email:").grid(row=4, column=0, sticky=tk.W, pady=2)
-        self.from_email_var = tk.StringVar()
-        from_email_entry = ttk.Entry(email_frame, textvariable=self.from_email_var, width=30)
-        from_email_entry.grid(row=4, column=1, sticky=(tk.W, tk.E), pady=2, padx=(10, 0))
+        # Server and account entries
+        for row, (label, var_name, default, masked) in enumerate(self.EMAIL_FIELDS):
+            ttk.Label(email_frame, text=label).grid(row=row, column=0, sticky=tk.W, pady=2)
+            var = tk.StringVar(value=default)
+            setattr(self, var_name, var)
+            entry = ttk.Entry(email_frame, textvariable=var, width=30, show="*" if masked else "")
+            entry.grid(row=row, column=1, sticky=(tk.W, tk.E), pady=2, padx=(10, 0))
         
         # Use TLS
         self.use_tls_var = tk.BooleanVar(value=True)
@@ -174,12 +193,12 @@ class SettingsWindow:
         
         # Intrusion settings
         ttk.Label(security_frame, text="Failed Login Attempts Before Alert:").pack(anchor=tk.W, pady=(10, 2))
-        self.max_attempts_var = tk.StringVar(value="3")
+        self.max_attempts_var = tk.StringVar(value=self.SECTION_DEFAULTS["security"]["max_attempts_var"])
         max_attempts_entry = ttk.Entry(security_frame, textvariable=self.max_attempts_var, width=10)
         max_attempts_entry.pack(anchor=tk.W, pady=2)
         
         ttk.Label(security_frame, text="Time Window for Failed Attempts (minutes):").pack(anchor=tk.W, pady=(10, 2))
-        self.time_window_var = tk.StringVar(value="15")
+        self.time_window_var = tk.StringVar(value=self.SECTION_DEFAULTS["security"]["time_window_var"])
         time_window_entry = ttk.Entry(security_frame, textvariable=self.time_window_var, width=10)
         time_window_entry.pack(anchor=tk.W, pady=2)
     
@@ -190,7 +209,7 @@ class SettingsWindow:
         
         # Auto-cleanup settings
         ttk.Label(system_frame, text="Auto-cleanup Evidence Files After (days):").pack(anchor=tk.W, pady=2)
-        self.cleanup_days_var = tk.StringVar(value="30")
+        self.cleanup_days_var = tk.StringVar(value=self.SECTION_DEFAULTS["system"]["cleanup_days_var"])
         cleanup_days_entry = ttk.Entry(system_frame, textvariable=self.cleanup_days_var, width=10)
         cleanup_days_entry.pack(anchor=tk.W, pady=2)
         
@@ -211,19 +230,33 @@ System Information:
     
     def load_settings(self):
         """Load current settings into the form"""
+        # Only the email section holds stored settings; nothing to fill until it exists
+        if "email" not in self._built_sections:
+            return
+        
         try:
             # Load email settings
             config = self.email_service.get_configuration_status()
             
-            if config['smtp_server']:
-                self.smtp_server_var.set(config['smtp_server'])
-            if config['smtp_port']:
-                self.smtp_port_var.set(str(config['smtp_port']))
-            if config['from_email']:
-                self.from_email_var.set(config['from_email'])
+            # Reset every entry so edits discarded with Cancel don't come back;
+            # the password is never shown again and has to be re-entered
+            stored = {
+                "smtp_server_var": config['smtp_server'],
+                "smtp_port_var": config['smtp_port'],
+                "email_username_var": self.email_service.username,
+                "from_email_var": config['from_email'],
+            }
+            for _, var_name, default, _ in self.EMAIL_FIELDS:
+                value = stored.get(var_name)
+                getattr(self, var_name).set(str(value) if value else default)
             
             self.use_tls_var.set(config['use_tls'])
             
+            for section, defaults in self.SECTION_DEFAULTS.items():
+                if section in self._built_sections:
+                    for var_name, default in defaults.items():
+                        getattr(self, var_name).set(default)
+            
             # Load recipients
             self.recipients_listbox.delete(0, tk.END)
             for recipient in config['recipients']:
@@ -236,6 +269,7 @@ System Information:
     
     def save_settings(self):
         """Save current settings"""
+        # The email tab is selected on open, so its variables always exist here
         try:
             # Validate email settings
             smtp_server = self.smtp_server_var.get().strip()
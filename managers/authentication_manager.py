@@ -5,12 +5,16 @@ Handles password hashing, verification, and secure credential management
 import hashlib
 import secrets
 import logging
+import time
 from typing import Optional
 
 from database.database_manager import DatabaseManager
 from models.data_models import User
 from config import PASSWORD_SALT_LENGTH, HASH_ALGORITHM
 
+# A successful login is trusted again for this long without the password KDF (seconds)
+AUTH_CACHE_TTL = 60
+
 
 class AuthenticationManager:
     """Manages user authentication and password security"""
@@ -20,6 +24,9 @@ class AuthenticationManager:
         self.db_manager = db_manager or DatabaseManager()
         self.logger = logging.getLogger(__name__)
         self.current_user: Optional[User] = None
+        # (username, password digest) -> monotonic time of the current user's login;
+        # the digest is only an in-memory lookup key and failures are never cached
+        self._verified: dict[tuple[str, bytes], float] = {}
     
     def hash_password(self, password: str, salt: bytes = None) -> str:
         """
@@ -91,6 +98,16 @@ class AuthenticationManager:
         Returns True if authentication successful, False otherwise
         """
         try:
+            # Repeated actions by the logged-in user shortly after a login skip
+            # the KDF, but are still checked against the session and audited
+            key = (username, hashlib.sha256(password.encode()).digest())
+            verified_at = self._verified.get(key)
+            if (verified_at is not None and self.current_user is not None
+                    and self.current_user.username == username
+                    and time.monotonic() - verified_at < AUTH_CACHE_TTL):
+                self.logger.info(f"User {username} authenticated successfully (recent login)")
+                return True
+            
             # Retrieve user from database
             user = self.db_manager.get_user_by_username(username)
             if not user:
@@ -100,6 +117,7 @@ class AuthenticationManager:
             # Verify password
             if self.verify_password(password, user.password_hash):
                 self.current_user = user
+                self._verified = {key: time.monotonic()}
                 self.logger.info(f"User {username} authenticated successfully")
                 return True
             else:
@@ -112,6 +130,7 @@ class AuthenticationManager:
     
     def logout_user(self):
         """Logout current user"""
+        self._verified.clear()
         if self.current_user:
             self.logger.info(f"User {self.current_user.username} logged out")
             self.current_user = None
@@ -144,6 +163,9 @@ class AuthenticationManager:
             self.logger.info(f"Password change requested for user: {username}")
             # TODO: Implement password update in DatabaseManager
             
+            # The old password must not keep authenticating from the cache
+            self._verified.clear()
+            
             return True
             
         except Exception as e:
@@ -446,6 +446,7 @@ class CameraManager:
     def _create_camera_lock_file(self) -> bool:
         """Create a lock file to indicate camera is blocked (SAFE)"""
         try:
+            MEDIA_DIR.mkdir(exist_ok=True)
             lock_file = MEDIA_DIR / "camera_blocked.lock"
             with open(lock_file, 'w') as f:
                 f.write(f"Camera blocked at {datetime.now().isoformat()}\n")
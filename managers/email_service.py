@@ -2,8 +2,11 @@
 Email service for Camera Privacy Manager
 Handles SMTP configuration, email notifications, and alert delivery
 """
+import atexit
 import smtplib
 import logging
+import threading
+import weakref
 from datetime import datetime
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -14,6 +17,67 @@ from pathlib import Path
 
 from config import DEFAULT_SMTP_PORT, EMAIL_TIMEOUT
 
+# Live SMTP senders; held weakly so discarded services and their sockets can be collected
+_open_senders = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_senders():
+    """Close the SMTP sessions still open at interpreter exit"""
+    for sender in list(_open_senders):
+        sender.close()
+
+
+class SMTPSender:
+    """Authenticated SMTP session kept open and reused across sends"""
+    
+    def __init__(self, server: str, port: int, username: str, password: str,
+                 use_tls: bool = True, timeout: int = EMAIL_TIMEOUT):
+        """Initialize sender; the connection is opened on first send"""
+        self.server = server
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self._smtp = None
+        self._lock = threading.Lock()
+        _open_senders.add(self)
+    
+    def _connect(self):
+        """Open the connection, negotiate TLS and log in"""
+        smtp = smtplib.SMTP(self.server, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                smtp.starttls()
+            smtp.login(self.username, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        self._smtp = smtp
+    
+    def send(self, msg):
+        """Send a message, reconnecting once if the server dropped the session"""
+        with self._lock:
+            if self._smtp is None:
+                self._connect()
+            try:
+                self._smtp.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                self._smtp = None
+                self._connect()
+                self._smtp.send_message(msg)
+    
+    def close(self):
+        """Close the SMTP session if one is open"""
+        with self._lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except (smtplib.SMTPException, OSError):
+                    self._smtp.close()
+                self._smtp = None
+
 
 class EmailService:
     """Manages email notifications and SMTP operations"""
@@ -29,6 +93,7 @@ class EmailService:
         self.to_emails = []
         self.use_tls = True
         self.is_configured = False
+        self._sender = None
     
     def configure_smtp(self, server: str, port: int, username: str, password: str, 
                       from_email: str = None, use_tls: bool = True) -> bool:
@@ -47,6 +112,7 @@ class EmailService:
             True if configuration successful, False otherwise
         """
         try:
+            self.close_connection()
             self.smtp_server = server
             self.smtp_port = port
             self.username = username
@@ -326,30 +392,45 @@ Camera Privacy Manager Security System
             self.logger.error(f"Failed to create email with attachment: {e}")
             return False
     
+    def _get_sender(self) -> SMTPSender:
+        """Return the shared SMTP sender, recreating it if settings changed"""
+        settings = (self.smtp_server, self.smtp_port, self.username, self.password, self.use_tls)
+        sender = self._sender
+        if sender is None or settings != (sender.server, sender.port, sender.username,
+                                          sender.password, sender.use_tls):
+            self.close_connection()
+            sender = self._sender = SMTPSender(*settings)
+        return sender
+    
+    def close_connection(self) -> None:
+        """Close the persistent SMTP session"""
+        if self._sender is not None:
+            self._sender.close()
+            self._sender = None
+    
     def _send_message(self, msg) -> bool:
         """Send email message via SMTP"""
         try:
-            with smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=EMAIL_TIMEOUT) as server:
-                if self.use_tls:
-                    server.starttls()
-                
-                server.login(self.username, self.password)
-                server.send_message(msg)
-                
+            self._get_sender().send(msg)
+            
             self.logger.info(f"Email sent successfully to {len(self.to_emails)} recipients")
             return True
             
         except smtplib.SMTPAuthenticationError as e:
             self.logger.error(f"SMTP authentication failed: {e}")
+            self.close_connection()
             return False
         except smtplib.SMTPConnectError as e:
             self.logger.error(f"SMTP connection failed: {e}")
+            self.close_connection()
             return False
         except smtplib.SMTPException as e:
             self.logger.error(f"SMTP error: {e}")
+            self.close_connection()
             return False
         except Exception as e:
             self.logger.error(f"Failed to send email: {e}")
+            self.close_connection()
             return False
     
     def _test_smtp_connection(self) -> bool:
@@ -399,6 +480,7 @@ Camera Privacy Manager Security System
     
     def clear_configuration(self) -> None:
         """Clear all configuration settings"""
+        self.close_connection()
         self.smtp_server = None
         self.smtp_port = DEFAULT_SMTP_PORT
         self.username = None
@@ -9,6 +9,13 @@ from typing import List, Optional
 from database.database_manager import DatabaseManager
 from models.data_models import LogEntry, User
 
+# SQL LIKE patterns selecting the actions that belong to each log type filter
+LOG_TYPE_ACTION_PATTERNS = {
+    "Camera Access": ["%CAMERA%"],
+    "Authentication": ["%AUTH%"],
+    "System Events": ["%SYSTEM%", "%SETUP%"],
+}
+
 
 class LogManager:
     """Manages activity logging and audit trail for camera operations"""
@@ -42,6 +49,19 @@ class LogManager:
             self.logger.error(f"Failed to log camera access: {e}")
             return False
     
+    def log_camera_access_async(self, user_id: int, action: str):
+        """
+        Queue a camera access action without waiting for the database write
+        
+        The row is written by the database manager's batch flusher, so this
+        is safe to call from UI callbacks.
+        """
+        try:
+            self.db_manager.log_access_async(user_id, action)
+            self.logger.info(f"Camera access queued: {action} by user {user_id}")
+        except Exception as e:
+            self.logger.error(f"Failed to queue camera access log: {e}")
+    
     def get_access_logs(self, user_id: int = None, limit: int = 100) -> List[LogEntry]:
         """
         Retrieve access logs
@@ -86,18 +106,49 @@ class LogManager:
             self.logger.error(f"Failed to log intrusion attempt: {e}")
             return False
     
-    def get_intrusion_logs(self, limit: int = 50) -> List:
+    def get_logs(self, start_date: Optional[datetime], end_date: Optional[datetime],
+                 type_filter: str = "All", limit: int = 1000) -> List[LogEntry]:
+        """
+        Retrieve access logs in a date range, filtered by log type in the database
+        
+        Args:
+            start_date: Start of date range, None for no lower bound
+            end_date: End of date range, None for no upper bound
+            type_filter: Log type name (e.g. 'Camera Access'); unknown types are not filtered
+            limit: Maximum number of logs to retrieve
+            
+        Returns:
+            List of LogEntry objects, newest first
+        """
+        try:
+            logs = self.db_manager.get_access_logs_in_range(
+                start_date, end_date, LOG_TYPE_ACTION_PATTERNS.get(type_filter), limit=limit
+            )
+            self.logger.info(f"Retrieved {len(logs)} {type_filter} logs for {start_date} to {end_date}")
+            return logs
+            
+        except Exception as e:
+            self.logger.error(f"Failed to retrieve logs: {e}")
+            return []
+    
+    def get_intrusion_logs(self, limit: int = 50, start_date: datetime = None,
+                           end_date: datetime = None) -> List:
         """
         Retrieve intrusion attempt logs
         
         Args:
             limit: Maximum number of logs to retrieve
+            start_date: Optional start of date range
+            end_date: Optional end of date range
             
         Returns:
             List of IntrusionAttempt objects
         """
         try:
-            attempts = self.db_manager.get_intrusion_attempts(limit)
+            if start_date is not None or end_date is not None:
+                attempts = self.db_manager.get_intrusion_attempts_in_range(start_date, end_date, limit)
+            else:
+                attempts = self.db_manager.get_intrusion_attempts(limit)
             self.logger.info(f"Retrieved {len(attempts)} intrusion logs")
             return attempts
             
@@ -172,27 +223,23 @@ class LogManager:
             self.logger.error(f"Failed to log system event: {e}")
             return False
     
-    def get_logs_by_date_range(self, start_date: datetime, end_date: datetime, user_id: int = None) -> List[LogEntry]:
+    def get_logs_by_date_range(self, start_date: Optional[datetime], end_date: Optional[datetime],
+                               user_id: int = None) -> List[LogEntry]:
         """
         Retrieve logs within a specific date range
         
         Args:
-            start_date: Start of date range
-            end_date: End of date range
+            start_date: Start of date range, None for no lower bound
+            end_date: End of date range, None for no upper bound
             user_id: Optional user ID to filter logs
             
         Returns:
             List of LogEntry objects within the date range
         """
         try:
-            # Get all logs first (this could be optimized with a database query)
-            all_logs = self.get_access_logs(user_id, limit=1000)
-            
-            # Filter by date range
-            filtered_logs = [
-                log for log in all_logs
-                if start_date <= log.timestamp <= end_date
-            ]
+            filtered_logs = self.db_manager.get_access_logs_in_range(
+                start_date, end_date, user_id=user_id, limit=1000
+            )
             
             self.logger.info(f"Retrieved {len(filtered_logs)} logs for date range {start_date} to {end_date}")
             return filtered_logs
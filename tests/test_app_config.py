@@ -0,0 +1,122 @@
+"""
+Unit tests for AppConfig's debounced settings persistence
+"""
+import unittest
+import tempfile
+import os
+import json
+import shutil
+import logging
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import app_config
+from app_config import AppConfig
+
+
+class TestAppConfigFlush(unittest.TestCase):
+    """Test cases for coalesced and batched settings saves"""
+    
+    def setUp(self):
+        """Set up a config writing to a temporary directory"""
+        self.temp_dir = tempfile.mkdtemp()
+        
+        # Skip __init__: it configures global logging, signal handlers and
+        # atexit hooks, none of which these tests exercise
+        self.config = AppConfig.__new__(AppConfig)
+        self.config.logger = logging.getLogger(__name__)
+        self.config.config_file = Path(self.temp_dir) / "app_settings.json"
+        self.config.settings = self.config.get_default_settings()
+        self.config._dirty = False
+        self.config._flush_timer = None
+        self.config._batch_depth = 0
+        self.config._flush_lock = threading.RLock()
+        
+        self.save = patch.object(
+            self.config, 'save_configuration', wraps=self.config.save_configuration
+        ).start()
+        patch.object(app_config, 'SETTINGS_FLUSH_DELAY', 0.05).start()
+    
+    def tearDown(self):
+        """Clean up pending timers and the temporary directory"""
+        patch.stopall()
+        if self.config._flush_timer:
+            self.config._flush_timer.cancel()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def read_settings(self):
+        """Load the settings file as written to disk"""
+        with open(self.config.config_file, encoding='utf-8') as f:
+            return json.load(f)
+    
+    def wait_for_save(self, timeout=2.0):
+        """Wait until the debounced save has run"""
+        deadline = time.monotonic() + timeout
+        while not self.save.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # Give a wrongly scheduled second save the chance to show up
+        time.sleep(0.15)
+    
+    def test_set_setting_coalesces_writes(self):
+        """Test several changes are saved together in one write"""
+        self.config.set_setting("security", "max_failed_attempts", 5)
+        self.config.set_setting("security", "auto_cleanup_days", 7)
+        self.config.set_setting("gui", "window_width", 640)
+        self.save.assert_not_called()
+        
+        self.wait_for_save()
+        self.assertEqual(self.save.call_count, 1)
+        settings = self.read_settings()
+        self.assertEqual(settings["security"]["max_failed_attempts"], 5)
+        self.assertEqual(settings["security"]["auto_cleanup_days"], 7)
+        self.assertEqual(settings["gui"]["window_width"], 640)
+    
+    def test_flush_writes_immediately(self):
+        """Test flush saves pending changes without waiting for the timer"""
+        self.config.set_setting("gui", "window_width", 640)
+        self.config.flush()
+        
+        self.assertEqual(self.save.call_count, 1)
+        self.assertEqual(self.read_settings()["gui"]["window_width"], 640)
+        self.assertFalse(self.config._dirty)
+        
+        # Nothing pending, so neither a second flush nor the timer writes again
+        self.config.flush()
+        time.sleep(0.15)
+        self.assertEqual(self.save.call_count, 1)
+    
+    def test_batch_suppresses_intermediate_writes(self):
+        """Test changes inside a batch are saved once when it exits"""
+        with self.config:
+            self.config.set_setting("gui", "window_width", 640)
+            time.sleep(0.15)
+            self.config.set_setting("gui", "window_height", 480)
+            self.save.assert_not_called()
+        
+        self.assertEqual(self.save.call_count, 1)
+        settings = self.read_settings()
+        self.assertEqual(settings["gui"]["window_width"], 640)
+        self.assertEqual(settings["gui"]["window_height"], 480)
+    
+    def test_failed_save_stays_dirty_and_retries(self):
+        """Test a failed write keeps the changes pending for the next flush"""
+        self.config.config_file = Path(self.temp_dir) / "missing" / "app_settings.json"
+        self.config.set_setting("gui", "window_width", 640)
+        self.config.flush()
+        
+        self.assertEqual(self.save.call_count, 1)
+        self.assertTrue(self.config._dirty)
+        self.assertFalse(self.config.config_file.exists())
+        
+        os.mkdir(self.config.config_file.parent)
+        self.config.flush()
+        
+        self.assertEqual(self.save.call_count, 2)
+        self.assertFalse(self.config._dirty)
+        self.assertEqual(self.read_settings()["gui"]["window_width"], 640)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,7 @@ Unit tests for AuthenticationManager
 import unittest
 import tempfile
 import os
+from unittest.mock import patch
 
 from managers.authentication_manager import AuthenticationManager
 from database.database_manager import DatabaseManager
@@ -99,6 +100,26 @@ class TestAuthenticationManager(unittest.TestCase):
         self.assertFalse(self.auth_manager.is_authenticated())
         self.assertIsNone(self.auth_manager.get_current_user())
     
+    def test_authenticate_user_recent_login(self):
+        """Test a recent login is reused only for the same session and password"""
+        username = "testuser"
+        password = "testpassword123"
+        self.auth_manager.setup_initial_password(username, password)
+        self.assertTrue(self.auth_manager.authenticate_user(username, password))
+        
+        with patch.object(self.auth_manager, 'verify_password') as verify:
+            self.assertTrue(self.auth_manager.authenticate_user(username, password))
+            verify.assert_not_called()
+        
+        # A wrong password is still checked and rejected
+        self.assertFalse(self.auth_manager.authenticate_user(username, "wrongpassword"))
+        
+        # Logging out drops the cached login
+        self.auth_manager.logout_user()
+        with patch.object(self.auth_manager, 'verify_password', return_value=True) as verify:
+            self.assertTrue(self.auth_manager.authenticate_user(username, password))
+            verify.assert_called_once()
+    
     def test_validate_password_strength(self):
         """Test password strength validation"""
         # Weak passwords
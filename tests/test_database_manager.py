@@ -4,7 +4,9 @@ Unit tests for DatabaseManager
 import unittest
 import tempfile
 import os
+import sqlite3
 from datetime import datetime
+from unittest.mock import MagicMock, patch
 
 from database.database_manager import DatabaseManager
 from models.data_models import User, LogEntry, IntrusionAttempt
@@ -78,6 +80,19 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertEqual(logs[1].action, "CAMERA_ENABLED")
         self.assertEqual(logs[0].user_id, user_id)
     
+    def test_iter_access_logs(self):
+        """Test streaming access logs yields LogEntry objects"""
+        user_id = self.db_manager.create_user("testuser", "hashed_password")
+        self.db_manager.log_access(user_id, "CAMERA_ENABLED")
+        
+        logs = self.db_manager.iter_access_logs(user_id)
+        self.assertNotIsInstance(logs, list)
+        
+        logs = list(logs)
+        self.assertEqual(len(logs), 1)
+        self.assertIsInstance(logs[0], LogEntry)
+        self.assertIsInstance(logs[0].timestamp, datetime)
+    
     def test_log_intrusion_attempt(self):
         """Test logging intrusion attempt"""
         intrusion_id = self.db_manager.log_intrusion_attempt("/path/to/media.mp4", "192.168.1.100")
@@ -97,6 +112,51 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertEqual(attempts[1].media_path, "/path/to/media1.mp4")
         self.assertEqual(attempts[0].ip_address, "192.168.1.101")
     
+    def test_get_logs_in_open_range(self):
+        """Test None range bounds are treated as unbounded"""
+        user_id = self.db_manager.create_user("testuser", "hashed_password")
+        self.db_manager.log_access(user_id, "CAMERA_ENABLED")
+        self.db_manager.log_intrusion_attempt("/path/to/media.mp4", "192.168.1.100")
+        
+        self.assertEqual(len(self.db_manager.get_access_logs_in_range(None, None)), 1)
+        self.assertEqual(len(self.db_manager.get_intrusion_attempts_in_range(None, datetime.max)), 1)
+        self.assertEqual(len(self.db_manager.get_access_logs_in_range(datetime.max, None)), 0)
+    
+    def test_log_access_async(self):
+        """Test queued access logs are written when flushed"""
+        user_id = self.db_manager.create_user("testuser", "hashed_password")
+        for _ in range(3):
+            self.db_manager.log_access_async(user_id, "CAMERA_ENABLED")
+        
+        self.db_manager.flush_pending_logs()
+        
+        logs = self.db_manager.get_access_logs(user_id)
+        self.assertEqual(len(logs), 3)
+    
+    def test_failed_flush_keeps_pending_logs(self):
+        """Test queued logs survive a failed flush and are written by the next one"""
+        user_id = self.db_manager.create_user("testuser", "hashed_password")
+        self.db_manager.log_access_async(user_id, "CAMERA_ENABLED")
+        self.db_manager.log_intrusion_attempt_async("/path/to/media.mp4")
+        
+        conn = MagicMock(wraps=self.db_manager._conn)
+        conn.executemany.side_effect = sqlite3.OperationalError("database is locked")
+        with patch.object(self.db_manager, '_conn', conn):
+            with self.assertRaises(sqlite3.OperationalError):
+                self.db_manager.flush_pending_logs()
+        
+        self.db_manager.flush_pending_logs()
+        self.assertEqual(len(self.db_manager.get_access_logs()), 1)
+        self.assertEqual(len(self.db_manager.get_intrusion_attempts()), 1)
+    
+    def test_log_intrusion_attempt_async_visible_to_reads(self):
+        """Test queued intrusion attempts are visible to subsequent reads"""
+        self.db_manager.log_intrusion_attempt_async("/path/to/media.mp4", "192.168.1.100")
+        
+        attempts = self.db_manager.get_intrusion_attempts()
+        self.assertEqual(len(attempts), 1)
+        self.assertEqual(attempts[0].media_path, "/path/to/media.mp4")
+    
     def test_get_user_count(self):
         """Test getting user count"""
         # Initially no users
@@ -108,6 +168,30 @@ class TestDatabaseManager(unittest.TestCase):
         
         self.db_manager.create_user("user2", "hash2")
         self.assertEqual(self.db_manager.get_user_count(), 2)
+    
+    def test_backup_to(self):
+        """Test online backup produces a readable copy of the database"""
+        self.db_manager.create_user("testuser", "hashed_password")
+        
+        backup_path = self.temp_db.name + ".bak"
+        try:
+            self.db_manager.backup_to(backup_path)
+            
+            backup_manager = DatabaseManager(backup_path)
+            try:
+                self.assertIsNotNone(backup_manager.get_user_by_username("testuser"))
+            finally:
+                backup_manager.close()
+        finally:
+            os.unlink(backup_path)
+    
+    def test_data_persists_after_close(self):
+        """Test data written on the shared connection survives reopening"""
+        self.db_manager.create_user("testuser", "hashed_password")
+        self.db_manager.close()
+        
+        self.db_manager = DatabaseManager(self.temp_db.name)
+        self.assertEqual(self.db_manager.get_user_count(), 1)
 
 
 if __name__ == '__main__':
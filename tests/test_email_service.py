@@ -4,11 +4,13 @@ Unit tests for EmailService
 import unittest
 import tempfile
 import os
+import gc
+import weakref
 from datetime import datetime
 from unittest.mock import MagicMock, patch, mock_open
 from pathlib import Path
 
-from managers.email_service import EmailService
+from managers.email_service import EmailService, _close_open_senders
 
 
 class TestEmailService(unittest.TestCase):
@@ -231,7 +233,7 @@ class TestEmailService(unittest.TestCase):
         
         # Mock SMTP server
         mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_smtp.return_value = mock_server
         
         result = self.email_service._send_email("Test Subject", "Test Body")
         
@@ -255,12 +257,57 @@ class TestEmailService(unittest.TestCase):
         # Mock SMTP authentication error
         mock_server = MagicMock()
         mock_server.login.side_effect = smtplib.SMTPAuthenticationError(535, "Authentication failed")
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_smtp.return_value = mock_server
         
         result = self.email_service._send_email("Test Subject", "Test Body")
         
         self.assertFalse(result)
     
+    @patch('smtplib.SMTP')
+    def test_send_message_reuses_connection(self, mock_smtp):
+        """Test consecutive messages share one SMTP session"""
+        self.email_service.is_configured = True
+        self.email_service.smtp_server = "smtp.gmail.com"
+        self.email_service.smtp_port = 587
+        self.email_service.username = "test@gmail.com"
+        self.email_service.password = "testpassword"
+        self.email_service.from_email = "test@gmail.com"
+        self.email_service.add_recipient("admin@example.com")
+        
+        mock_server = MagicMock()
+        mock_smtp.return_value = mock_server
+        
+        self.assertTrue(self.email_service._send_email("First", "Body"))
+        self.assertTrue(self.email_service._send_email("Second", "Body"))
+        
+        mock_smtp.assert_called_once()
+        mock_server.login.assert_called_once()
+        self.assertEqual(mock_server.send_message.call_count, 2)
+        
+        self.email_service.close_connection()
+        mock_server.quit.assert_called_once()
+    
+    @patch('smtplib.SMTP')
+    def test_open_sender_closed_at_exit(self, mock_smtp):
+        """Test the exit hook closes open sessions without keeping services alive"""
+        self.email_service.smtp_server = "smtp.gmail.com"
+        self.email_service.username = "test@gmail.com"
+        self.email_service.password = "testpassword"
+        self.email_service.add_recipient("admin@example.com")
+        
+        mock_server = MagicMock()
+        mock_smtp.return_value = mock_server
+        self.assertTrue(self.email_service._send_email("Subject", "Body"))
+        
+        _close_open_senders()
+        mock_server.quit.assert_called_once()
+        
+        # A discarded service is not pinned until interpreter exit
+        service_ref = weakref.ref(self.email_service)
+        self.email_service = None
+        gc.collect()
+        self.assertIsNone(service_ref())
+    
     @patch('smtplib.SMTP')
     def test_test_smtp_connection_success(self, mock_smtp):
         """Test successful SMTP connection test"""
@@ -55,6 +55,16 @@ class TestLogManager(unittest.TestCase):
         self.assertEqual(len(logs), 1)
         self.assertEqual(logs[0].action, "CAMERA_DISABLED")
     
+    def test_log_camera_access_async(self):
+        """Test queuing camera access logs"""
+        self.log_manager.log_camera_access_async(self.test_user_id, "CAMERA_ENABLED")
+        self.log_manager.log_camera_access_async(self.test_user_id, "CAMERA_DISABLED")
+        
+        # Reads see queued rows
+        logs = self.log_manager.get_access_logs(self.test_user_id)
+        self.assertEqual(len(logs), 2)
+        self.assertEqual({log.action for log in logs}, {"CAMERA_ENABLED", "CAMERA_DISABLED"})
+    
     def test_get_access_logs(self):
         """Test retrieving access logs"""
         # Log multiple actions
@@ -202,6 +212,38 @@ class TestLogManager(unittest.TestCase):
         self.assertEqual(len(logs), 1)
         self.assertEqual(logs[0].action, "CURRENT_ACTION")
     
+    def test_get_logs_filters_by_type(self):
+        """Test type filtering is applied to logs in the date range"""
+        self.log_manager.log_camera_access(self.test_user_id, "CAMERA_ENABLED")
+        self.log_manager.log_camera_access(self.test_user_id, "AUTH_SUCCESS_testuser")
+        self.log_manager.log_camera_access(self.test_user_id, "SETUP_COMPLETED")
+        
+        start = datetime.now() - timedelta(days=1)
+        end = datetime.now() + timedelta(days=1)
+        
+        camera_logs = self.log_manager.get_logs(start, end, "Camera Access")
+        self.assertEqual([log.action for log in camera_logs], ["CAMERA_ENABLED"])
+        
+        system_logs = self.log_manager.get_logs(start, end, "System Events")
+        self.assertEqual([log.action for log in system_logs], ["SETUP_COMPLETED"])
+        
+        self.assertEqual(len(self.log_manager.get_logs(start, end, "All")), 3)
+    
+    def test_get_intrusion_logs_in_date_range(self):
+        """Test retrieving intrusion logs restricted to a date range"""
+        self.log_manager.log_intrusion_attempt("/path/to/video.avi")
+        
+        now = datetime.now()
+        recent = self.log_manager.get_intrusion_logs(
+            start_date=now - timedelta(days=1), end_date=now + timedelta(days=1)
+        )
+        self.assertEqual(len(recent), 1)
+        
+        old = self.log_manager.get_intrusion_logs(
+            start_date=now - timedelta(days=10), end_date=now - timedelta(days=9)
+        )
+        self.assertEqual(len(old), 0)
+    
     def test_get_logs_by_action(self):
         """Test retrieving logs by action pattern"""
         # Log various actions